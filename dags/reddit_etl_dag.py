@@ -1,15 +1,20 @@
 """
 Production-ready Airflow DAG for Reddit ETL pipeline.
+
+Extraction, validation and upload are mapped per subreddit, so each subreddit
+runs as its own task instance and retries independently. Extraction tasks run
+in the ``reddit_api`` pool (4 slots, created by ``airflow-init``) to cap
+concurrent Reddit API usage.
 """
 
+import asyncio
 import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from airflow import DAG
-from airflow.operators.python import PythonOperator
-from airflow.operators.bash import BashOperator
+from airflow.decorators import task
 from airflow.utils.task_group import TaskGroup
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,11 +22,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from airflow.models import Variable
 
 from src.pipelines.reddit_pipeline import run_reddit_pipeline
-from src.pipelines.s3_pipeline import upload_to_s3
+from src.pipelines.s3_pipeline import upload_to_s3_async
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Airflow pool limiting concurrent Reddit API extraction tasks
+REDDIT_API_POOL = 'reddit_api'
+
 # Default arguments
 default_args = {
     'owner': 'data-engineering-team',
@@ -46,109 +54,124 @@ dag = DAG(
 )
 
 
-def extract_reddit_data(**context):
+@task
+def get_subreddits() -> list:
     """
-    Extract data from Reddit.
+    Read the subreddits to extract from Airflow Variables.
     
     Returns:
-        Path to output file
+        List of subreddit names
     """
-    # Get configuration from Airflow Variables or use defaults
-    subreddits = Variable.get(
+    return Variable.get(
         'reddit_subreddits',
         default_var='science+politics+technology+relationships'
     ).split('+')
+
+
+@task(pool=REDDIT_API_POOL)
+def extract_reddit_data(subreddit: str, **context) -> str:
+    """
+    Extract data from a single subreddit.
     
+    Args:
+        subreddit: Subreddit name
+        
+    Returns:
+        Path to output file
+    """
     time_filter = Variable.get('reddit_time_filter', default_var='all')
     limit = int(Variable.get('reddit_limit', default_var='5000'))
     
     # Generate output filename with date
     execution_date = context.get('execution_date', datetime.now())
     date_str = execution_date.strftime("%Y%m%d")
-    output_filename = f"reddit_{date_str}"
+    output_filename = f"reddit_{date_str}_{subreddit}"
     
-    logger.info(f"Extracting Reddit data for date: {date_str}")
+    logger.info(f"Extracting r/{subreddit} data for date: {date_str}")
     
     # Run extraction pipeline
     output_path = run_reddit_pipeline(
-        subreddits=subreddits,
+        subreddits=[subreddit],
         time_filter=time_filter,
         limit_per_subreddit=limit,
         sort='top',
-        output_filename=output_filename
+        output_filename=output_filename,
+        file_format='parquet'
     )
     
     logger.info(f"Extraction complete: {output_path}")
     return output_path
 
 
-def upload_to_s3_task(**context):
-    """
-    Upload extracted data to S3.
-    """
-    # Get file path from previous task
-    ti = context['ti']
-    file_path = ti.xcom_pull(task_ids='extract_reddit_data')
-    
-    if not file_path:
-        raise ValueError("No file path received from extraction task")
-    
-    logger.info(f"Uploading to S3: {file_path}")
-    
-    # Upload to S3
-    s3_uri = upload_to_s3(local_file_path=file_path)
-    
-    logger.info(f"Upload complete: {s3_uri}")
-    return s3_uri
-
-
-def validate_data_quality(**context):
+@task
+def validate_data_quality(file_path: str) -> str:
     """
     Validate data quality after extraction.
+    
+    Args:
+        file_path: Path to the extracted file
+        
+    Returns:
+        Path to the validated file
     """
     from src.processing.data_validator import DataValidator
     import pandas as pd
-    
-    ti = context['ti']
-    file_path = ti.xcom_pull(task_ids='extract_reddit_data')
+    import pyarrow.dataset as ds
     
     if not file_path:
         raise ValueError("No file path received from extraction task")
     
     logger.info(f"Validating data quality: {file_path}")
     
-    # Load and validate
-    df = pd.read_csv(file_path)
+    # Scan only the columns the validator inspects
     validator = DataValidator()
+    dataset = ds.dataset(file_path, format='parquet')
+    columns = [col for col in validator.EXPECTED_COLUMNS if col in dataset.schema.names]
+    scanner = dataset.scanner(columns=columns)
+    
+    # Row count comes from Parquet metadata; skip materializing an empty file
+    row_count = scanner.count_rows()
+    if row_count == 0:
+        df = pd.DataFrame()
+    else:
+        df = scanner.to_table().to_pandas(self_destruct=True)
     result = validator.validate(df)
     
     if not result.is_valid:
         logger.error(f"Data validation failed: {result}")
         raise ValueError(f"Data quality check failed: {', '.join(result.errors)}")
     
-    logger.info(f"Data validation passed: {len(df)} rows")
-    return result.stats
+    logger.info(f"Data validation passed: {row_count} rows")
+    return file_path
 
 
-# Task definitions
-with TaskGroup("extraction_group", dag=dag) as extraction_group:
-    extract_task = PythonOperator(
-        task_id='extract_reddit_data',
-        python_callable=extract_reddit_data,
-        dag=dag,
-    )
+@task(task_id='upload_to_s3')
+def upload_to_s3_task(file_path: str) -> str:
+    """
+    Upload extracted data to S3.
     
-    validate_task = PythonOperator(
-        task_id='validate_data_quality',
-        python_callable=validate_data_quality,
-        dag=dag,
-    )
+    Args:
+        file_path: Path to the validated file
+        
+    Returns:
+        S3 URI of uploaded file
+    """
+    if not file_path:
+        raise ValueError("No file path received from validation task")
+    
+    logger.info(f"Uploading to S3: {file_path}")
+    
+    # Upload to S3
+    s3_uri = asyncio.run(upload_to_s3_async(local_file_path=file_path))
+    
+    logger.info(f"Upload complete: {s3_uri}")
+    return s3_uri
 
-upload_task = PythonOperator(
-    task_id='upload_to_s3',
-    python_callable=upload_to_s3_task,
-    dag=dag,
-)
 
-# Task dependencies
-extract_task >> validate_task >> upload_task
+# Task definitions: one mapped task instance per subreddit
+with dag:
+    with TaskGroup("extraction_group") as extraction_group:
+        extracted_files = extract_reddit_data.expand(subreddit=get_subreddits())
+        validated_files = validate_data_quality.expand(file_path=extracted_files)
+    
+    upload_to_s3_task.expand(file_path=validated_files)
@@ -32,6 +32,7 @@ setup(
     install_requires=[
         "pandas>=2.1.0",
         "numpy>=1.26.0",
+        "pyarrow>=14.0.0",
         "praw>=7.7.0",
         "boto3>=1.31.0",
         "nltk>=3.8.0",
@@ -55,5 +56,17 @@ setup(
             "jupyter>=1.0.0",
             "ipykernel>=6.26.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "async": [
+            "aioboto3>=12.0.0",
+        ],
+        "onnx": [
+            "optimum[onnxruntime]>=1.14.0",
+        ],
+        "numba": [
+            "numba>=0.58.0",
+        ],
     },
 )
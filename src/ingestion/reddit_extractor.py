@@ -2,12 +2,24 @@
 Production-ready Reddit data extractor with error handling, retries, and rate limiting.
 """
 
-import time
-from typing import List, Dict, Optional, Iterator
+import operator
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, List, Dict, Optional, Iterator, Tuple
 import praw
 from praw import Reddit
+from prawcore import Requestor
 from prawcore.exceptions import PrawcoreException
 import pandas as pd
+import pyarrow as pa
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.utils.exceptions import RedditAPIException
 from src.utils.logger import get_logger
 from src.utils.config import get_config
@@ -15,6 +27,15 @@ from src.utils.config import get_config
 logger = get_logger(__name__)
 
 
+class OrjsonRequestor(Requestor):
+    """prawcore requestor that decodes Reddit API responses with orjson."""
+    
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+
 class RedditExtractor:
     """Reddit data extractor with production-grade error handling."""
     
@@ -37,6 +58,58 @@ class RedditExtractor:
         'distinguished'
     )
     
+    # Column dtypes for extracted posts, declared up front so pandas never falls
+    # back to object columns. Text is Arrow-backed; integers and booleans are
+    # nullable so a missing value does not fail the whole batch.
+    POST_DTYPES = {
+        'id': 'string[pyarrow]',
+        'subreddit': 'string[pyarrow]',
+        'title': 'string[pyarrow]',
+        'selftext': 'string[pyarrow]',
+        'score': 'Int32',
+        'num_comments': 'Int32',
+        'author': 'string[pyarrow]',
+        'created_utc': 'Int64',
+        'upvote_ratio': 'float32',
+        'url': 'string[pyarrow]',
+        'permalink': 'string[pyarrow]',
+        'is_self': 'boolean',
+        'over_18': 'boolean',
+        'stickied': 'boolean',
+        'distinguished': 'string[pyarrow]'
+    }
+    
+    # Arrow schema for extracted posts, used when streaming to Parquet
+    POST_SCHEMA = pa.schema([
+        ('id', pa.string()),
+        ('subreddit', pa.string()),
+        ('title', pa.string()),
+        ('selftext', pa.string()),
+        ('score', pa.int32()),
+        ('num_comments', pa.int32()),
+        ('author', pa.string()),
+        ('created_utc', pa.int64()),
+        ('upvote_ratio', pa.float32()),
+        ('url', pa.string()),
+        ('permalink', pa.string()),
+        ('is_self', pa.bool_()),
+        ('over_18', pa.bool_()),
+        ('stickied', pa.bool_()),
+        ('distinguished', pa.string())
+    ])
+    
+    # Fetches all POST_FIELDS from a submission in a single call
+    _ATTRGETTER = operator.attrgetter(*POST_FIELDS)
+    
+    # Converters for fields that need post-processing after the bulk fetch
+    _FIELD_CONVERTERS = {
+        'subreddit': lambda value: str(value) if value else None,  # Subreddit object to name
+        'author': lambda value: str(value) if value else None,  # Redditor object to string
+        'created_utc': lambda value: int(value) if value else None
+    }
+    # (position in POST_FIELDS, converter) pairs, resolved once
+    _CONVERTER_SLOTS = tuple(zip(map(POST_FIELDS.index, _FIELD_CONVERTERS), _FIELD_CONVERTERS.values()))
+    
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize Reddit extractor.
@@ -52,19 +125,34 @@ class RedditExtractor:
             self.reddit_config = RedditConfig(**config)
         
         self.reddit: Optional[Reddit] = None
+        # PRAW instances are not thread-safe, so each worker thread gets its own
+        self._local = threading.local()
         self._connect()
     
+    def _create_reddit(self) -> Reddit:
+        """Create a read-only PRAW instance from the configured credentials."""
+        return praw.Reddit(
+            client_id=self.reddit_config.client_id,
+            client_secret=self.reddit_config.client_secret,
+            user_agent=self.reddit_config.user_agent,
+            ratelimit_seconds=self.reddit_config.ratelimit_seconds,
+            requestor_class=OrjsonRequestor if ORJSON_AVAILABLE else None,
+            read_only=True
+        )
+    
+    def _client(self) -> Reddit:
+        """Return the PRAW instance bound to the calling thread."""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._create_reddit()
+            self._local.reddit = reddit
+        return reddit
+    
     def _connect(self) -> None:
         """Establish connection to Reddit API."""
         try:
-            self.reddit = praw.Reddit(
-                client_id=self.reddit_config.client_id,
-                client_secret=self.reddit_config.client_secret,
-                user_agent=self.reddit_config.user_agent,
-                read_only=True
-            )
-            # Test connection
-            self.reddit.user.me()
+            self.reddit = self._create_reddit()
+            self._local.reddit = self.reddit
             logger.info("Successfully connected to Reddit API")
         except Exception as e:
             logger.error(f"Failed to connect to Reddit API: {str(e)}")
@@ -76,7 +164,7 @@ class RedditExtractor:
         time_filter: str = 'all',
         limit: Optional[int] = None,
         sort: str = 'top'
-    ) -> List[Dict]:
+    ) -> Dict[str, List]:
         """
         Extract posts from specified subreddit(s).
         
@@ -87,7 +175,7 @@ class RedditExtractor:
             sort: Sort method ('top', 'hot', 'new', 'rising')
             
         Returns:
-            List of post dictionaries
+            Column-oriented dict mapping each of POST_FIELDS to its list of values
         """
         if not self.reddit:
             self._connect()
@@ -95,38 +183,95 @@ class RedditExtractor:
         logger.info(f"Extracting posts from r/{subreddit} with time_filter={time_filter}, limit={limit}")
         
         try:
-            subreddit_instance = self.reddit.subreddit(subreddit)
+            posts = self._get_listing(subreddit, time_filter, limit, sort)
+            
+            columns = {field: [] for field in self.POST_FIELDS}
+            appenders = [columns[field].append for field in self.POST_FIELDS]
+            extracted_count = 0
+            
+            for post in posts:
+                try:
+                    values = self._extract_post_values(post)
+                except Exception as e:
+                    logger.warning(f"Failed to extract post {post.id}: {str(e)}")
+                    continue
+                
+                for append, value in zip(appenders, values):
+                    append(value)
+                extracted_count += 1
+                
+                if extracted_count % 100 == 0:
+                    logger.debug(f"Extracted {extracted_count} posts...")
             
-            # Get posts based on sort method
-            if sort == 'top':
-                posts = subreddit_instance.top(time_filter=time_filter, limit=limit)
-            elif sort == 'hot':
-                posts = subreddit_instance.hot(limit=limit)
-            elif sort == 'new':
-                posts = subreddit_instance.new(limit=limit)
-            elif sort == 'rising':
-                posts = subreddit_instance.rising(limit=limit)
-            else:
-                raise ValueError(f"Invalid sort method: {sort}")
+            logger.info(f"Successfully extracted {extracted_count} posts from r/{subreddit}")
+            return columns
             
-            post_list = []
+        except PrawcoreException as e:
+            logger.error(f"Reddit API error: {str(e)}")
+            raise RedditAPIException(f"Reddit API error: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error during extraction: {str(e)}")
+            raise RedditAPIException(f"Post extraction failed: {str(e)}")
+    
+    def extract_record_batches(
+        self,
+        subreddit: str,
+        time_filter: str = 'all',
+        limit: Optional[int] = None,
+        sort: str = 'top',
+        batch_rows: int = 1000
+    ) -> List[pa.RecordBatch]:
+        """
+        Extract posts from a subreddit directly into Arrow record batches.
+        
+        Rows are converted to Arrow every batch_rows posts while the listing
+        is still being paged, so at most one batch of Python values is staged
+        at a time and the conversion runs on the extracting thread.
+        
+        Args:
+            subreddit: Subreddit name(s) - can be single or multiple joined with '+'
+            time_filter: Time filter ('all', 'day', 'week', 'month', 'year')
+            limit: Maximum number of posts to extract
+            sort: Sort method ('top', 'hot', 'new', 'rising')
+            batch_rows: Maximum number of rows per record batch
+            
+        Returns:
+            List of RecordBatches with POST_SCHEMA
+        """
+        if not self.reddit:
+            self._connect()
+        
+        logger.info(f"Extracting posts from r/{subreddit} with time_filter={time_filter}, limit={limit}")
+        
+        try:
+            posts = self._get_listing(subreddit, time_filter, limit, sort)
+            
+            columns = [[] for _ in self.POST_FIELDS]
+            appenders = [column.append for column in columns]
+            batches = []
             extracted_count = 0
             
             for post in posts:
                 try:
-                    post_dict = self._extract_post_fields(post)
-                    post_list.append(post_dict)
-                    extracted_count += 1
-                    
-                    if extracted_count % 100 == 0:
-                        logger.debug(f"Extracted {extracted_count} posts...")
-                    
+                    values = self._extract_post_values(post)
                 except Exception as e:
                     logger.warning(f"Failed to extract post {post.id}: {str(e)}")
                     continue
+                
+                for append, value in zip(appenders, values):
+                    append(value)
+                extracted_count += 1
+                
+                if extracted_count % batch_rows == 0:
+                    batches.append(self._to_record_batch(columns))
+                    for column in columns:
+                        column.clear()
+            
+            if columns[0]:
+                batches.append(self._to_record_batch(columns))
             
             logger.info(f"Successfully extracted {extracted_count} posts from r/{subreddit}")
-            return post_list
+            return batches
             
         except PrawcoreException as e:
             logger.error(f"Reddit API error: {str(e)}")
@@ -135,6 +280,42 @@ class RedditExtractor:
             logger.error(f"Unexpected error during extraction: {str(e)}")
             raise RedditAPIException(f"Post extraction failed: {str(e)}")
     
+    def _get_listing(
+        self,
+        subreddit: str,
+        time_filter: str,
+        limit: Optional[int],
+        sort: str
+    ) -> Iterator:
+        """
+        Get the post listing for a subreddit and sort method.
+        
+        PRAW sends the listing limit with every page request (1024 when
+        unbounded) and Reddit serves its 100-item maximum per page, so no
+        page-size override is needed.
+        
+        Returns:
+            PRAW ListingGenerator over submissions
+        """
+        subreddit_instance = self._client().subreddit(subreddit)
+        
+        if sort == 'top':
+            return subreddit_instance.top(time_filter=time_filter, limit=limit)
+        elif sort == 'hot':
+            return subreddit_instance.hot(limit=limit)
+        elif sort == 'new':
+            return subreddit_instance.new(limit=limit)
+        elif sort == 'rising':
+            return subreddit_instance.rising(limit=limit)
+        raise ValueError(f"Invalid sort method: {sort}")
+    
+    def _to_record_batch(self, columns: List[List]) -> pa.RecordBatch:
+        """Convert column value lists, in POST_FIELDS order, to a RecordBatch."""
+        return pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, self.POST_SCHEMA)],
+            schema=self.POST_SCHEMA
+        )
+    
     def _extract_post_fields(self, post) -> Dict:
         """
         Extract specified fields from a Reddit post object.
@@ -145,21 +326,95 @@ class RedditExtractor:
         Returns:
             Dictionary with extracted fields
         """
-        post_dict = {}
-        for field in self.POST_FIELDS:
-            try:
-                value = getattr(post, field, None)
-                # Handle special cases
-                if field == 'author' and value:
-                    value = str(value)  # Convert Redditor object to string
-                elif field == 'created_utc':
-                    value = int(value) if value else None
-                post_dict[field] = value
-            except Exception as e:
-                logger.debug(f"Failed to extract field {field}: {str(e)}")
-                post_dict[field] = None
+        return dict(zip(self.POST_FIELDS, self._extract_post_values(post)))
+    
+    def _extract_post_values(self, post) -> List:
+        """
+        Extract POST_FIELDS values from a Reddit post object, in field order.
+        
+        Args:
+            post: PRAW submission object
+            
+        Returns:
+            List of field values
+        """
+        values = list(self._ATTRGETTER(post))
+        for index, convert in self._CONVERTER_SLOTS:
+            values[index] = convert(values[index])
+        return values
+    
+    def _build_dataframe(self, columns: Dict[str, List]) -> pd.DataFrame:
+        """
+        Build a DataFrame from column lists, one typed array per column.
+        
+        Args:
+            columns: Dict mapping each of POST_FIELDS to its list of values
+            
+        Returns:
+            DataFrame with POST_DTYPES applied
+        """
+        return pd.DataFrame(
+            {
+                field: pd.Series(values, dtype=self.POST_DTYPES.get(field))
+                for field, values in columns.items()
+            },
+            copy=False
+        )
+    
+    def _extract_dataframe(self, **kwargs) -> pd.DataFrame:
+        """Extract one subreddit with extract_posts and build its DataFrame."""
+        return self._build_dataframe(self.extract_posts(**kwargs))
+    
+    def _iter_extracted(
+        self,
+        subreddits: List[str],
+        time_filter: str,
+        limit_per_subreddit: Optional[int],
+        sort: str,
+        max_workers: Optional[int],
+        extract: Optional[Callable] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Extract subreddits concurrently, yielding each one as it completes.
+        
+        Each worker thread uses its own PRAW instance; PRAW's rate limiter
+        handles API throttling. Failed subreddits are logged and skipped.
+        Repeated subreddit names (compared case-insensitively, as Reddit does)
+        are extracted once, under their first spelling.
+        
+        Args:
+            extract: Per-subreddit extraction method. Defaults to extract_posts
+        
+        Yields:
+            (subreddit, result) tuples in completion order
+        """
+        extract = extract or self.extract_posts
+        unique = {}
+        for subreddit in subreddits:
+            unique.setdefault(subreddit.lower(), subreddit)
+        subreddits = list(unique.values())
+        workers = max_workers or max(len(subreddits), 1)
         
-        return post_dict
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='reddit-extract') as executor:
+            futures = {
+                executor.submit(
+                    extract,
+                    subreddit=subreddit,
+                    time_filter=time_filter,
+                    limit=limit_per_subreddit,
+                    sort=sort
+                ): subreddit
+                for subreddit in subreddits
+            }
+            
+            for future in as_completed(futures):
+                subreddit = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to extract from r/{subreddit}: {str(e)}")
+                    continue
+                yield subreddit, result
     
     def extract_posts_batch(
         self,
@@ -167,49 +422,121 @@ class RedditExtractor:
         time_filter: str = 'all',
         limit_per_subreddit: Optional[int] = None,
         sort: str = 'top',
-        delay_between_subreddits: float = 1.0
+        delay_between_subreddits: Optional[float] = None,
+        max_workers: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Extract posts from multiple subreddits and combine into a DataFrame.
         
+        Subreddits are extracted concurrently, each worker thread using its own
+        PRAW instance; PRAW's rate limiter handles API throttling.
+        
         Args:
             subreddits: List of subreddit names
             time_filter: Time filter for extraction
             limit_per_subreddit: Limit per subreddit
             sort: Sort method
-            delay_between_subreddits: Delay in seconds between subreddit extractions
+            delay_between_subreddits: Deprecated and ignored; subreddits are
+                extracted concurrently and PRAW handles throttling
+            max_workers: Maximum concurrent extractions. Defaults to one per subreddit
             
         Returns:
             Combined DataFrame with all posts
         """
-        all_posts = []
+        if delay_between_subreddits is not None:
+            warnings.warn(
+                "delay_between_subreddits is deprecated and ignored; subreddits "
+                "are extracted concurrently and PRAW's rate limiter handles throttling",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        
+        extracted = dict(self._iter_extracted(
+            subreddits, time_filter, limit_per_subreddit, sort, max_workers
+        ))
         
+        # Merge in request order so output is deterministic
+        all_posts = {field: [] for field in self.POST_FIELDS}
         for subreddit in subreddits:
-            try:
-                posts = self.extract_posts(
-                    subreddit=subreddit,
-                    time_filter=time_filter,
-                    limit=limit_per_subreddit,
-                    sort=sort
-                )
-                all_posts.extend(posts)
-                
-                # Rate limiting
-                if delay_between_subreddits > 0:
-                    time.sleep(delay_between_subreddits)
-                    
-            except Exception as e:
-                logger.error(f"Failed to extract from r/{subreddit}: {str(e)}")
-                continue
+            for field, values in extracted.pop(subreddit, {}).items():
+                all_posts[field].extend(values)
         
-        if not all_posts:
+        if not all_posts['id']:
             logger.warning("No posts extracted from any subreddit")
             return pd.DataFrame()
         
-        df = pd.DataFrame(all_posts)
+        df = self._build_dataframe(all_posts)
         logger.info(f"Combined {len(df)} posts from {len(subreddits)} subreddits")
         return df
     
+    def iter_dataframes(
+        self,
+        subreddits: List[str],
+        time_filter: str = 'all',
+        limit_per_subreddit: Optional[int] = None,
+        sort: str = 'top',
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Extract posts from multiple subreddits, one DataFrame per subreddit.
+        
+        Subreddits are extracted concurrently and each worker thread builds its
+        own DataFrame, yielded as soon as it completes, so callers can process
+        one subreddit while the others are still being fetched.
+        
+        Args:
+            subreddits: List of subreddit names
+            time_filter: Time filter for extraction
+            limit_per_subreddit: Limit per subreddit
+            sort: Sort method
+            max_workers: Maximum concurrent extractions. Defaults to one per subreddit
+            
+        Yields:
+            (subreddit, DataFrame) tuples in completion order
+        """
+        for subreddit, df in self._iter_extracted(
+            subreddits, time_filter, limit_per_subreddit, sort, max_workers,
+            extract=self._extract_dataframe
+        ):
+            if df.empty:
+                logger.warning(f"No posts extracted from r/{subreddit}")
+                continue
+            yield subreddit, df
+    
+    def iter_record_batches(
+        self,
+        subreddits: List[str],
+        time_filter: str = 'all',
+        limit_per_subreddit: Optional[int] = None,
+        sort: str = 'top',
+        max_workers: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Extract posts from multiple subreddits as Arrow record batches.
+        
+        Each subreddit is converted to Arrow by its worker thread as it is
+        extracted, and its batches are yielded as soon as it completes, so
+        callers can write them out without holding every subreddit in memory.
+        
+        Args:
+            subreddits: List of subreddit names
+            time_filter: Time filter for extraction
+            limit_per_subreddit: Limit per subreddit
+            sort: Sort method
+            max_workers: Maximum concurrent extractions. Defaults to one per subreddit
+            
+        Yields:
+            RecordBatches with POST_SCHEMA
+        """
+        for subreddit, batches in self._iter_extracted(
+            subreddits, time_filter, limit_per_subreddit, sort, max_workers,
+            extract=self.extract_record_batches
+        ):
+            if not batches:
+                logger.warning(f"No posts extracted from r/{subreddit}")
+                continue
+            yield from batches
+    
     def extract_posts_streaming(
         self,
         subreddit: str,
@@ -231,7 +558,7 @@ class RedditExtractor:
             self._connect()
         
         try:
-            subreddit_instance = self.reddit.subreddit(subreddit)
+            subreddit_instance = self._client().subreddit(subreddit)
             posts = subreddit_instance.top(time_filter=time_filter)
             
             batch = []
@@ -2,9 +2,12 @@
 Production-ready sentiment analysis module using VADER and transformer models.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -21,22 +24,154 @@ try:
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from src.utils.logger import get_logger
 from src.utils.exceptions import ProcessingException
 
 logger = get_logger(__name__)
 
+# VADER score keys and the output columns they map to, in column order
+VADER_KEYS = ('neg', 'neu', 'pos', 'compound')
+VADER_COLUMNS = tuple(f'vader_{key}' for key in VADER_KEYS)
+
+# Sentiment label categories, in ascending polarity
+SENTIMENT_LABELS = ['NEGATIVE', 'NEUTRAL', 'POSITIVE']
+
+# Scores returned for missing or empty text
+EMPTY_VADER_SCORES = {'vader_neg': 0.0, 'vader_neu': 1.0, 'vader_pos': 0.0, 'vader_compound': 0.0}
+EMPTY_TRANSFORMER_SCORES = {'transformer_label': 'NEUTRAL', 'transformer_score': 0.0}
+
+# Token limit applied when tokenizing text for the transformer
+TRANSFORMER_MAX_LENGTH = 512
+
+# VADER analyzer owned by each scoring worker process, set by _worker_init
+_worker_vader = None
+
+
+def _score_texts(polarity_scores, texts) -> np.ndarray:
+    """
+    Score texts with a VADER polarity_scores function.
+    
+    Args:
+        polarity_scores: SentimentIntensityAnalyzer.polarity_scores
+        texts: Texts to analyze
+        
+    Returns:
+        float32 array of shape (len(texts), 4) in VADER_COLUMNS order;
+        rows that fail to score are NaN
+    """
+    scores = np.empty((len(texts), len(VADER_KEYS)), dtype=np.float32)
+    empty_scores = [EMPTY_VADER_SCORES[column] for column in VADER_COLUMNS]
+    
+    for row, text in enumerate(texts):
+        if pd.isna(text) or not text:
+            scores[row] = empty_scores
+            continue
+        try:
+            result = polarity_scores(str(text))
+            scores[row] = [result[key] for key in VADER_KEYS]
+        except Exception as e:
+            logger.debug(f"VADER analysis failed: {str(e)}")
+            scores[row] = np.nan
+    
+    return scores
+
+
+def _count_vader_labels(compound: np.ndarray) -> Tuple[int, int, int]:
+    """Count negative, neutral and positive compound scores in a single pass."""
+    negative = 0
+    positive = 0
+    for value in compound:
+        if value >= 0.05:
+            positive += 1
+        elif value <= -0.05:
+            negative += 1
+    return negative, len(compound) - negative - positive, positive
+
+
+if NUMBA_AVAILABLE:
+    _count_vader_labels = njit(cache=True)(_count_vader_labels)
+
+
+def summarize_vader(compound: np.ndarray) -> Tuple[int, int, int]:
+    """
+    Count VADER compound scores per sentiment label.
+    
+    Uses the same thresholds as the sentiment_label column (NaN counts as
+    neutral) without materializing the labels.
+    
+    Args:
+        compound: Array of VADER compound scores
+        
+    Returns:
+        Tuple of (negative, neutral, positive) counts
+    """
+    compound = np.ascontiguousarray(compound, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _count_vader_labels(compound)
+    
+    negative = int(np.count_nonzero(compound <= -0.05))
+    positive = int(np.count_nonzero(compound >= 0.05))
+    return negative, len(compound) - negative - positive, positive
+
+
+def _ensure_vader_lexicon() -> None:
+    """Download the VADER lexicon only if NLTK cannot already find it."""
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon', quiet=True)
+
+
+def _worker_init() -> None:
+    """Create the VADER analyzer once per worker process."""
+    global _worker_vader
+    _worker_vader = SentimentIntensityAnalyzer()
+
+
+def _score_chunk(texts: np.ndarray) -> np.ndarray:
+    """Score a chunk of texts with the worker's VADER analyzer."""
+    return _score_texts(_worker_vader.polarity_scores, texts)
+
 
 class SentimentAnalyzer:
     """Sentiment analysis using multiple methods."""
     
-    def __init__(self, use_transformer: bool = True, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment-latest"):
+    def __init__(
+        self,
+        use_transformer: bool = True,
+        model_name: str = "cardiffnlp/twitter-roberta-base-sentiment-latest",
+        use_onnx: bool = False,
+        device: Optional[Union[int, str]] = None
+    ):
         """
         Initialize sentiment analyzer.
         
         Args:
             use_transformer: Whether to use transformer model (requires transformers library)
             model_name: HuggingFace model name for transformer-based analysis
+            use_onnx: Run the transformer as an int8-quantized ONNX Runtime model
+                (requires optimum[onnxruntime]); falls back to PyTorch otherwise
+            device: PyTorch device for the transformer (-1 for CPU, a CUDA index,
+                or 'mps'). If None, uses CUDA or Apple MPS when available
         """
         self.use_transformer = use_transformer and TRANSFORMERS_AVAILABLE
         self.model_name = model_name
@@ -44,7 +179,7 @@ class SentimentAnalyzer:
         # Initialize VADER
         if NLTK_AVAILABLE:
             try:
-                nltk.download('vader_lexicon', quiet=True)
+                _ensure_vader_lexicon()
                 self.vader = SentimentIntensityAnalyzer()
                 logger.info("VADER sentiment analyzer initialized")
             except Exception as e:
@@ -56,19 +191,80 @@ class SentimentAnalyzer:
         
         # Initialize transformer model
         self.transformer_pipeline = None
+        if self.use_transformer and use_onnx and not ONNX_AVAILABLE:
+            logger.warning("optimum[onnxruntime] not available, using PyTorch transformer")
+        
         if self.use_transformer:
             try:
-                self.transformer_pipeline = pipeline(
-                    "sentiment-analysis",
-                    model=model_name,
-                    tokenizer=model_name,
-                    device=-1  # Use CPU, set to 0 for GPU
-                )
+                if use_onnx and ONNX_AVAILABLE:
+                    self.transformer_pipeline = pipeline(
+                        "sentiment-analysis",
+                        model=self._load_onnx_model(model_name),
+                        tokenizer=AutoTokenizer.from_pretrained(model_name)
+                    )
+                else:
+                    device = self._resolve_device(device)
+                    # Half precision on accelerators halves memory traffic
+                    self.transformer_pipeline = pipeline(
+                        "sentiment-analysis",
+                        model=model_name,
+                        tokenizer=model_name,
+                        device=device,
+                        torch_dtype=torch.float16 if self._is_accelerator(device) else torch.float32
+                    )
                 logger.info(f"Transformer model {model_name} initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize transformer model: {str(e)}")
                 self.use_transformer = False
     
+    @staticmethod
+    def _resolve_device(device: Optional[Union[int, str]]) -> Union[int, str]:
+        """Pick the pipeline device: explicit choice, else CUDA, MPS, then CPU."""
+        if device is not None:
+            return device
+        if TORCH_AVAILABLE and torch.cuda.is_available():
+            return 0
+        if TORCH_AVAILABLE and torch.backends.mps.is_available():
+            return 'mps'
+        return -1
+    
+    @staticmethod
+    def _is_accelerator(device: Union[int, str]) -> bool:
+        """Whether a pipeline device is a CUDA or MPS accelerator rather than the CPU."""
+        if isinstance(device, int):
+            return device >= 0
+        device = str(device).lower()
+        return device.startswith('cuda') or device.startswith('mps')
+    
+    @staticmethod
+    def _load_onnx_model(model_name: str, cache_dir: Path = Path("models/onnx")):
+        """
+        Load an int8 dynamically quantized ONNX export of a model.
+        
+        The model is exported and quantized (per-channel, AVX-512 VNNI) on first
+        use and cached under cache_dir for later runs.
+        
+        Args:
+            model_name: HuggingFace model name
+            cache_dir: Directory holding quantized exports
+            
+        Returns:
+            ORTModelForSequenceClassification running the quantized graph
+        """
+        save_dir = cache_dir / model_name.replace('/', '--')
+        quantized_file = "model_quantized.onnx"
+        
+        if not (save_dir / quantized_file).exists():
+            logger.info(f"Exporting {model_name} to quantized ONNX in {save_dir}")
+            model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=save_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+            )
+        
+        return ORTModelForSequenceClassification.from_pretrained(save_dir, file_name=quantized_file)
+    
     def analyze_vader(self, text: str) -> Dict[str, float]:
         """
         Analyze sentiment using VADER.
@@ -82,8 +278,8 @@ class SentimentAnalyzer:
         if self.vader is None:
             raise ProcessingException("VADER analyzer not available")
         
-        if not text or pd.isna(text):
-            return {'neg': 0.0, 'neu': 1.0, 'pos': 0.0, 'compound': 0.0}
+        if pd.isna(text) or not text:
+            return dict(EMPTY_VADER_SCORES)
         
         scores = self.vader.polarity_scores(str(text))
         return {
@@ -106,32 +302,101 @@ class SentimentAnalyzer:
         if self.transformer_pipeline is None:
             raise ProcessingException("Transformer model not available")
         
-        if not text or pd.isna(text):
-            return {'transformer_label': 'NEUTRAL', 'transformer_score': 0.0}
+        if pd.isna(text) or not text:
+            return dict(EMPTY_TRANSFORMER_SCORES)
         
         try:
-            # Truncate text if too long (most models have token limits)
-            max_length = 512
-            text_str = str(text)[:max_length]
-            
-            result = self.transformer_pipeline(text_str)[0]
-            
-            # Normalize label to standard format
-            label = result['label'].upper()
-            if 'POSITIVE' in label or 'POS' in label:
-                label = 'POSITIVE'
-            elif 'NEGATIVE' in label or 'NEG' in label:
-                label = 'NEGATIVE'
-            else:
-                label = 'NEUTRAL'
+            result = self.transformer_pipeline(
+                str(text),
+                truncation=True,
+                max_length=TRANSFORMER_MAX_LENGTH
+            )[0]
             
             return {
-                'transformer_label': label,
+                'transformer_label': self._normalize_label(result['label']),
                 'transformer_score': result['score']
             }
         except Exception as e:
             logger.warning(f"Transformer analysis failed for text: {str(e)}")
-            return {'transformer_label': 'NEUTRAL', 'transformer_score': 0.0}
+            return dict(EMPTY_TRANSFORMER_SCORES)
+    
+    def analyze_transformer_batch(self, texts: List, batch_size: int = 32) -> List[Dict]:
+        """
+        Analyze sentiment for many texts with batched transformer inference.
+        
+        Missing and empty texts are skipped and scored as neutral. The rest
+        are tokenized once per batch (truncated to TRANSFORMER_MAX_LENGTH
+        tokens) and fed to the pipeline's model directly.
+        
+        Args:
+            texts: Texts to analyze
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            List of transformer score dictionaries, one per text
+        """
+        if self.transformer_pipeline is None:
+            raise ProcessingException("Transformer model not available")
+        
+        results = [dict(EMPTY_TRANSFORMER_SCORES) for _ in texts]
+        positions = [i for i, text in enumerate(texts) if not pd.isna(text) and text]
+        if not positions:
+            return results
+        
+        try:
+            labels, scores = self._predict([str(texts[i]) for i in positions], batch_size)
+        except Exception as e:
+            logger.warning(f"Batched transformer analysis failed: {str(e)}")
+            return results
+        
+        for i, label, score in zip(positions, labels, scores):
+            results[i] = {
+                'transformer_label': label,
+                'transformer_score': score
+            }
+        return results
+    
+    def _predict(self, texts: List[str], batch_size: int) -> Tuple[List[str], List[float]]:
+        """
+        Classify texts with the pipeline's tokenizer and model.
+        
+        Args:
+            texts: Non-empty texts to classify
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            Normalized labels and their softmax probabilities
+        """
+        tokenizer = self.transformer_pipeline.tokenizer
+        model = self.transformer_pipeline.model
+        id2label = model.config.id2label
+        labels, scores = [], []
+        
+        with torch.inference_mode():
+            for start in range(0, len(texts), batch_size):
+                batch = tokenizer(
+                    texts[start:start + batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=TRANSFORMER_MAX_LENGTH,
+                    return_tensors='pt'
+                ).to(model.device)
+                probabilities = torch.softmax(model(**batch).logits, dim=-1)
+                best_scores, best_ids = probabilities.max(dim=-1)
+                labels.extend(self._normalize_label(id2label[i]) for i in best_ids.tolist())
+                scores.extend(best_scores.float().tolist())
+        
+        return labels, scores
+    
+    @staticmethod
+    def _normalize_label(label: str) -> str:
+        """Normalize a model label to POSITIVE, NEGATIVE or NEUTRAL."""
+        label = label.upper()
+        if 'POSITIVE' in label or 'POS' in label:
+            return 'POSITIVE'
+        elif 'NEGATIVE' in label or 'NEG' in label:
+            return 'NEGATIVE'
+        return 'NEUTRAL'
     
     def analyze(self, text: str) -> Dict[str, float]:
         """
@@ -161,37 +426,48 @@ class SentimentAnalyzer:
             except Exception as e:
                 logger.debug(f"Transformer analysis failed: {str(e)}")
         
-        # Combined sentiment label
+        results['sentiment_label'] = self._combined_label(results)
+        return results
+    
+    @staticmethod
+    def _combined_label(results: Dict) -> str:
+        """Derive the overall label, preferring VADER's compound score."""
         if 'vader_compound' in results:
             compound = results['vader_compound']
             if compound >= 0.05:
-                results['sentiment_label'] = 'POSITIVE'
+                return 'POSITIVE'
             elif compound <= -0.05:
-                results['sentiment_label'] = 'NEGATIVE'
-            else:
-                results['sentiment_label'] = 'NEUTRAL'
+                return 'NEGATIVE'
+            return 'NEUTRAL'
         elif 'transformer_label' in results:
-            results['sentiment_label'] = results['transformer_label']
-        else:
-            results['sentiment_label'] = 'NEUTRAL'
-        
-        return results
+            return results['transformer_label']
+        return 'NEUTRAL'
     
     def analyze_dataframe(
         self,
         df: pd.DataFrame,
         text_column: str = 'title',
         batch_size: int = 100,
-        show_progress: bool = True
+        show_progress: bool = True,
+        n_jobs: int = 1,
+        inplace: bool = False
     ) -> pd.DataFrame:
         """
         Analyze sentiment for all rows in a DataFrame.
         
+        Each distinct text is scored once and its scores are reused for every
+        row that repeats it (crossposts, reposts, bot titles); since both
+        models are deterministic the output is identical to scoring each row.
+        Transformer inference runs in batches of batch_size.
+        
         Args:
             df: DataFrame with text to analyze
             text_column: Name of column containing text
-            batch_size: Batch size for processing
+            batch_size: Batch size for transformer inference
             show_progress: Whether to show progress
+            n_jobs: Number of processes for VADER scoring (-1 for all cores)
+            inplace: Add the sentiment columns to df itself instead of to a
+                shallow copy; existing column data is never copied either way
             
         Returns:
             DataFrame with added sentiment columns
@@ -201,28 +477,120 @@ class SentimentAnalyzer:
         
         logger.info(f"Analyzing sentiment for {len(df)} rows")
         
-        results_list = []
+        # Score distinct texts only; codes map each row back to its text
+        codes, texts = pd.factorize(df[text_column].to_numpy(), use_na_sentinel=False)
+        if len(texts) < len(codes):
+            logger.debug(f"Scoring {len(texts)} distinct texts for {len(codes)} rows")
+        columns = {}
         
-        iterator = df.iterrows()
-        if show_progress:
-            try:
-                from tqdm import tqdm
-                iterator = tqdm(df.iterrows(), total=len(df), desc="Analyzing sentiment")
-            except ImportError:
-                pass
+        if self.vader:
+            vader_scores = self._vader_scores(texts, show_progress, n_jobs)[codes]
+            for position, column in enumerate(VADER_COLUMNS):
+                columns[column] = vader_scores[:, position]
+        
+        if self.use_transformer and self.transformer_pipeline:
+            transformer_scores = self.analyze_transformer_batch(texts, batch_size=batch_size)
+            labels = np.array([scores['transformer_label'] for scores in transformer_scores], dtype=object)
+            scores = np.fromiter(
+                (scores['transformer_score'] for scores in transformer_scores),
+                dtype=np.float32,
+                count=len(texts)
+            )
+            columns['transformer_label'] = labels[codes]
+            columns['transformer_score'] = scores[codes]
         
-        for idx, row in iterator:
-            text = row[text_column]
-            sentiment_scores = self.analyze(text)
-            results_list.append(sentiment_scores)
+        if 'vader_compound' in columns:
+            compound = columns['vader_compound']
+            labels = np.where(
+                compound >= 0.05, 'POSITIVE',
+                np.where(compound <= -0.05, 'NEGATIVE', 'NEUTRAL')
+            )
+        elif 'transformer_label' in columns:
+            labels = columns['transformer_label']
+        else:
+            labels = np.full(len(codes), 'NEUTRAL')
+        columns['sentiment_label'] = pd.Categorical(labels, categories=SENTIMENT_LABELS)
         
-        # Convert to DataFrame and merge
-        sentiment_df = pd.DataFrame(results_list, index=df.index)
-        result_df = pd.concat([df, sentiment_df], axis=1)
+        # Attach the score arrays as columns; a shallow copy shares the
+        # existing column data, so no frame is duplicated
+        result_df = df if inplace else df.copy(deep=False)
+        for column, values in columns.items():
+            result_df[column] = values
         
         logger.info(f"Sentiment analysis complete: {len(result_df)} rows processed")
         return result_df
     
+    def _vader_scores(
+        self,
+        texts: np.ndarray,
+        show_progress: bool = False,
+        n_jobs: int = 1
+    ) -> np.ndarray:
+        """
+        Score texts with VADER, optionally across a process pool.
+        
+        VADER is pure Python, so with n_jobs > 1 the texts are split into
+        chunks scored by worker processes, each with its own analyzer.
+        
+        Args:
+            texts: Texts to analyze
+            show_progress: Whether to show progress
+            n_jobs: Number of processes (-1 for all cores)
+            
+        Returns:
+            float32 array of shape (len(texts), 4) in VADER_COLUMNS order
+        """
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        
+        if n_jobs <= 1 or len(texts) < n_jobs:
+            return _score_texts(
+                self.vader.polarity_scores,
+                self._progress(texts, len(texts)) if show_progress else texts
+            )
+        
+        chunks = np.array_split(texts, n_jobs * 4)
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_worker_init) as executor:
+            results = executor.map(_score_chunk, chunks)
+            if show_progress:
+                results = self._progress(results, len(chunks))
+            return np.concatenate(list(results))
+    
+    @staticmethod
+    def _progress(iterable, total: int):
+        """Wrap an iterable in a tqdm progress bar when tqdm is installed."""
+        try:
+            from tqdm import tqdm
+            return tqdm(iterable, total=total, desc="Analyzing sentiment")
+        except ImportError:
+            return iterable
+    
+    @staticmethod
+    def _column_stats(series: pd.Series) -> Dict[str, float]:
+        """
+        Compute mean, std, min and max of a numeric column.
+        
+        Works on a single float64 copy of the non-null values instead of one
+        pandas reduction per statistic; std uses ddof=1 like pandas.
+        
+        Args:
+            series: Numeric column
+            
+        Returns:
+            Dictionary with mean, std, min and max (NaN when undefined)
+        """
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return {'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan}
+        
+        return {
+            'mean': float(values.mean()),
+            'std': float(values.std(ddof=1)) if values.size > 1 else np.nan,
+            'min': float(values.min()),
+            'max': float(values.max())
+        }
+    
     def get_sentiment_summary(self, df: pd.DataFrame) -> Dict:
         """
         Get summary statistics of sentiment analysis.
@@ -235,8 +603,21 @@ class SentimentAnalyzer:
         """
         summary = {}
         
-        if 'sentiment_label' in df.columns:
-            label_counts = df['sentiment_label'].value_counts().to_dict()
+        label_counts = None
+        if 'vader_compound' in df.columns:
+            # sentiment_label follows VADER's compound score; count it directly
+            compound = df['vader_compound'].to_numpy(dtype=np.float64, na_value=np.nan)
+            label_counts = {
+                label: count
+                for label, count in zip(SENTIMENT_LABELS, summarize_vader(compound))
+                if count > 0
+            }
+        elif 'sentiment_label' in df.columns:
+            label_counts = df['sentiment_label'].value_counts()
+            # Categorical columns also count unused categories
+            label_counts = label_counts[label_counts > 0].to_dict()
+        
+        if label_counts is not None:
             summary['label_distribution'] = label_counts
             
             total = len(df)
@@ -246,19 +627,9 @@ class SentimentAnalyzer:
             }
         
         if 'vader_compound' in df.columns:
-            summary['vader_compound_stats'] = {
-                'mean': float(df['vader_compound'].mean()),
-                'std': float(df['vader_compound'].std()),
-                'min': float(df['vader_compound'].min()),
-                'max': float(df['vader_compound'].max())
-            }
+            summary['vader_compound_stats'] = self._column_stats(df['vader_compound'])
         
         if 'transformer_score' in df.columns:
-            summary['transformer_score_stats'] = {
-                'mean': float(df['transformer_score'].mean()),
-                'std': float(df['transformer_score'].std()),
-                'min': float(df['transformer_score'].min()),
-                'max': float(df['transformer_score'].max())
-            }
+            summary['transformer_score_stats'] = self._column_stats(df['transformer_score'])
         
         return summary
@@ -2,10 +2,13 @@
 Production-ready Reddit data pipeline orchestrator.
 """
 
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from src.ingestion.reddit_extractor import RedditExtractor
 from src.processing.data_transformer import DataTransformer
 from src.processing.data_validator import DataValidator
@@ -15,6 +18,15 @@ from src.utils.exceptions import RedditPipelineException
 
 logger = get_logger(__name__)
 
+# Parquet compression for pipeline output. zstd level 3 compresses the
+# text-heavy columns well beyond Snappy at comparable write speed.
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Transformed subreddit chunks waiting for the writer thread. Bounds memory
+# when extraction and transformation outpace the disk.
+WRITE_QUEUE_SIZE = 2
+
 
 class RedditPipeline:
     """Complete Reddit data extraction and processing pipeline."""
@@ -35,11 +47,23 @@ class RedditPipeline:
         sort: str = 'top',
         output_filename: Optional[str] = None,
         validate: bool = True,
-        transform: bool = True
+        transform: bool = True,
+        file_format: str = 'parquet'
     ) -> str:
         """
         Run the complete Reddit data pipeline.
         
+        The stages overlap: subreddits are extracted concurrently, each one is
+        transformed as soon as it arrives, and a writer thread appends
+        transformed chunks to the output file while later subreddits are still
+        being fetched. Posts already written from an earlier subreddit are
+        dropped, as the transformer only deduplicates within one. Each chunk
+        is reduced to validation aggregates as it is queued, and validation
+        runs once on the merged aggregates at the end, since its checks
+        (duplicate IDs, null percentages, subreddit distribution) apply to the
+        whole dataset; the output file is removed if it fails. Rows are
+        written in extraction completion order.
+        
         Args:
             subreddits: List of subreddit names to extract from
             time_filter: Time filter ('all', 'day', 'week', 'month', 'year')
@@ -48,36 +72,74 @@ class RedditPipeline:
             output_filename: Output filename (without extension). If None, auto-generated
             validate: Whether to validate data
             transform: Whether to transform data
+            file_format: Output file format ('parquet' or 'csv')
             
         Returns:
             Path to output file
         """
+        output_path = None
         try:
             logger.info(f"Starting Reddit pipeline for subreddits: {subreddits}")
             
-            # Step 1: Extract data
-            logger.info("Step 1: Extracting data from Reddit")
-            df = self.extractor.extract_posts_batch(
-                subreddits=subreddits,
-                time_filter=time_filter,
-                limit_per_subreddit=limit_per_subreddit,
-                sort=sort
+            file_format = file_format.lower()
+            if file_format not in ('csv', 'parquet'):
+                raise ValueError(f"Unsupported file format: {file_format}")
+            output_path = self._output_path(output_filename, file_format)
+            
+            chunks = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            writer_errors = []
+            writer = threading.Thread(
+                target=self._write_chunks,
+                args=(chunks, output_path, file_format, writer_errors),
+                name='pipeline-writer',
+                daemon=True
             )
+            writer.start()
             
-            if df.empty:
-                raise RedditPipelineException("No data extracted from Reddit")
+            # Steps 1-2: Extract and transform each subreddit as it arrives
+            logger.info("Step 1: Extracting and transforming data from Reddit")
+            accumulator = self.validator.accumulator() if validate else None
+            seen_ids = set()
+            total_rows = 0
+            try:
+                for subreddit, df in self.extractor.iter_dataframes(
+                    subreddits=subreddits,
+                    time_filter=time_filter,
+                    limit_per_subreddit=limit_per_subreddit,
+                    sort=sort
+                ):
+                    if transform:
+                        df = self.transformer.transform_reddit_posts(df)
+                        if seen_ids:
+                            df = df[~df['id'].isin(seen_ids)]
+                        seen_ids.update(df['id'])
+                    if df.empty:
+                        continue
+                    
+                    if accumulator is not None:
+                        accumulator.add(df)
+                    total_rows += len(df)
+                    chunks.put(df)
+                    logger.debug(f"Queued {len(df)} posts from r/{subreddit} for writing")
+                    
+                    if writer_errors:
+                        break
+            finally:
+                chunks.put(None)
+                writer.join()
+            
+            if writer_errors:
+                raise writer_errors[0]
             
-            logger.info(f"Extracted {len(df)} posts")
+            if total_rows == 0:
+                raise RedditPipelineException("No data extracted from Reddit")
             
-            # Step 2: Transform data
-            if transform:
-                logger.info("Step 2: Transforming data")
-                df = self.transformer.transform_reddit_posts(df)
+            logger.info(f"Extracted {total_rows} posts")
             
             # Step 3: Validate data
             if validate:
                 logger.info("Step 3: Validating data")
-                validation_result = self.validator.validate(df)
+                validation_result = accumulator.result()
                 
                 if not validation_result.is_valid:
                     logger.error(f"Data validation failed:\n{validation_result}")
@@ -89,44 +151,154 @@ class RedditPipeline:
                 if validation_result.warnings:
                     logger.warning(f"Data validation warnings: {', '.join(validation_result.warnings)}")
             
-            # Step 4: Save to file
-            logger.info("Step 4: Saving data to file")
-            if output_filename is None:
-                date_str = datetime.now().strftime("%Y%m%d")
-                output_filename = f"reddit_{date_str}"
-            
-            output_path = self._save_dataframe(df, output_filename)
-            
             logger.info(f"Pipeline completed successfully. Output: {output_path}")
-            return output_path
+            return str(output_path)
             
         except Exception as e:
+            if output_path is not None:
+                output_path.unlink(missing_ok=True)
             logger.error(f"Pipeline failed: {str(e)}")
             raise RedditPipelineException(f"Pipeline execution failed: {str(e)}")
     
-    def _save_dataframe(self, df: pd.DataFrame, filename: str) -> str:
+    def _write_chunks(
+        self,
+        chunks: queue.Queue,
+        output_path: Path,
+        file_format: str,
+        errors: List[Exception]
+    ) -> None:
         """
-        Save DataFrame to CSV file.
+        Append DataFrame chunks from a queue to one output file.
+        
+        Runs on the writer thread until a None sentinel arrives. Parquet
+        chunks become row groups of a single file, cast to the first chunk's
+        schema; CSV chunks are appended with a single header. After a failure
+        the error is recorded and remaining chunks are drained unwritten so
+        the producer never blocks.
         
         Args:
-            df: DataFrame to save
-            filename: Filename without extension
-            
-        Returns:
-            Path to saved file
+            chunks: Queue of DataFrames, terminated by None
+            output_path: Path to output file
+            file_format: Output file format ('parquet' or 'csv')
+            errors: List the first write error is appended to
         """
-        output_dir = self.config.paths.output_path
-        output_dir.mkdir(parents=True, exist_ok=True)
+        writer = None
+        first_chunk = True
+        try:
+            while True:
+                df = chunks.get()
+                if df is None:
+                    break
+                if errors:
+                    continue
+                
+                try:
+                    if file_format == 'parquet':
+                        if first_chunk:
+                            table = pa.Table.from_pandas(df, preserve_index=False)
+                            writer = pq.ParquetWriter(
+                                output_path,
+                                table.schema,
+                                compression=PARQUET_COMPRESSION,
+                                compression_level=PARQUET_COMPRESSION_LEVEL
+                            )
+                        else:
+                            table = pa.Table.from_pandas(df, schema=writer.schema, preserve_index=False)
+                        writer.write_table(table)
+                    else:
+                        df_export = self.transformer.prepare_for_export(df, format='csv')
+                        df_export.to_csv(
+                            output_path,
+                            mode='w' if first_chunk else 'a',
+                            header=first_chunk,
+                            index=False,
+                            na_rep=''
+                        )
+                    first_chunk = False
+                    logger.debug(f"Wrote {len(df)} posts to {output_path}")
+                except Exception as e:
+                    logger.error(f"Failed to write chunk to {output_path}: {str(e)}")
+                    errors.append(e)
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    def run_streaming(
+        self,
+        subreddits: List[str],
+        time_filter: str = 'all',
+        limit_per_subreddit: Optional[int] = None,
+        sort: str = 'top',
+        output_filename: Optional[str] = None
+    ) -> str:
+        """
+        Stream raw extracted posts straight to a Parquet file.
         
-        output_path = output_dir / f"{filename}.csv"
+        Each subreddit is written as its own row group as soon as it is
+        extracted, so peak memory is bounded by the largest subreddit rather
+        than the whole run. Transformation and validation are skipped.
         
-        # Prepare for export
-        df_export = self.transformer.prepare_for_export(df, format='csv')
+        Args:
+            subreddits: List of subreddit names to extract from
+            time_filter: Time filter ('all', 'day', 'week', 'month', 'year')
+            limit_per_subreddit: Maximum posts per subreddit
+            sort: Sort method ('top', 'hot', 'new', 'rising')
+            output_filename: Output filename (without extension). If None, auto-generated
+            
+        Returns:
+            Path to output file
+        """
+        try:
+            logger.info(f"Starting streaming Reddit pipeline for subreddits: {subreddits}")
+            
+            output_path = self._output_path(output_filename, 'parquet')
+            total_rows = 0
+            
+            with pq.ParquetWriter(
+                output_path,
+                self.extractor.POST_SCHEMA,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL
+            ) as writer:
+                for batch in self.extractor.iter_record_batches(
+                    subreddits=subreddits,
+                    time_filter=time_filter,
+                    limit_per_subreddit=limit_per_subreddit,
+                    sort=sort
+                ):
+                    writer.write_batch(batch)
+                    total_rows += batch.num_rows
+                    logger.debug(f"Wrote {batch.num_rows} posts to {output_path}")
+            
+            if total_rows == 0:
+                output_path.unlink(missing_ok=True)
+                raise RedditPipelineException("No data extracted from Reddit")
+            
+            logger.info(f"Streaming pipeline completed: {total_rows} posts written to {output_path}")
+            return str(output_path)
+            
+        except Exception as e:
+            logger.error(f"Streaming pipeline failed: {str(e)}")
+            raise RedditPipelineException(f"Streaming pipeline execution failed: {str(e)}")
+    
+    def _output_path(self, filename: Optional[str], file_format: str) -> Path:
+        """
+        Resolve the output file path, creating the output directory.
         
-        df_export.to_csv(output_path, index=False)
-        logger.info(f"Data saved to {output_path}")
+        Args:
+            filename: Filename without extension. If None, date-based name is used
+            file_format: File extension without the dot
+            
+        Returns:
+            Path to output file
+        """
+        if filename is None:
+            date_str = datetime.now().strftime("%Y%m%d")
+            filename = f"reddit_{date_str}"
         
-        return str(output_path)
+        output_dir = self.config.paths.output_path
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir / f"{filename}.{file_format}"
 
 
 def run_reddit_pipeline(
@@ -134,7 +306,9 @@ def run_reddit_pipeline(
     time_filter: str = 'all',
     limit_per_subreddit: Optional[int] = None,
     sort: str = 'top',
-    output_filename: Optional[str] = None
+    output_filename: Optional[str] = None,
+    file_format: str = 'parquet',
+    stream: bool = False
 ) -> str:
     """
     Convenience function to run the Reddit pipeline.
@@ -145,15 +319,27 @@ def run_reddit_pipeline(
         limit_per_subreddit: Maximum posts per subreddit
         sort: Sort method
         output_filename: Output filename
+        file_format: Output file format ('parquet' or 'csv')
+        stream: Stream raw posts to Parquet per subreddit, skipping transform
+            and validation (file_format is ignored)
         
     Returns:
         Path to output file
     """
     pipeline = RedditPipeline()
+    if stream:
+        return pipeline.run_streaming(
+            subreddits=subreddits,
+            time_filter=time_filter,
+            limit_per_subreddit=limit_per_subreddit,
+            sort=sort,
+            output_filename=output_filename
+        )
     return pipeline.run(
         subreddits=subreddits,
         time_filter=time_filter,
         limit_per_subreddit=limit_per_subreddit,
         sort=sort,
-        output_filename=output_filename
+        output_filename=output_filename,
+        file_format=file_format
     )
@@ -4,6 +4,7 @@ Production-ready S3 upload pipeline orchestrator.
 
 from pathlib import Path
 from typing import Optional
+from boto3.s3.transfer import TransferConfig
 from src.ingestion.s3_uploader import S3Uploader
 from src.utils.config import get_config
 from src.utils.logger import get_logger
@@ -60,11 +61,50 @@ class S3Pipeline:
             logger.error(f"S3 upload failed: {str(e)}")
             raise RedditPipelineException(f"S3 upload failed: {str(e)}")
     
+    async def upload_file_async(
+        self,
+        local_file_path: str,
+        s3_key: Optional[str] = None,
+        metadata: Optional[dict] = None
+    ) -> str:
+        """
+        Upload a file to S3 from a coroutine.
+        
+        Args:
+            local_file_path: Path to local file
+            s3_key: S3 object key (optional, auto-generated if not provided)
+            metadata: Optional metadata dictionary
+            
+        Returns:
+            S3 URI of uploaded file
+        """
+        try:
+            logger.info(f"Starting async S3 upload for file: {local_file_path}")
+            
+            # Validate file exists
+            file_path = Path(local_file_path)
+            if not file_path.exists():
+                raise RedditPipelineException(f"File not found: {local_file_path}")
+            
+            s3_uri = await self.uploader.upload_file_async(
+                local_file_path=str(file_path),
+                s3_key=s3_key,
+                metadata=metadata
+            )
+            
+            logger.info(f"S3 upload completed successfully: {s3_uri}")
+            return s3_uri
+            
+        except Exception as e:
+            logger.error(f"S3 upload failed: {str(e)}")
+            raise RedditPipelineException(f"S3 upload failed: {str(e)}")
+    
     def upload_dataframe(
         self,
         df,
         s3_key: str,
-        format: str = 'csv',
+        format: str = 'parquet',
+        transfer_config: Optional[TransferConfig] = None,
         **kwargs
     ) -> str:
         """
@@ -73,7 +113,8 @@ class S3Pipeline:
         Args:
             df: pandas DataFrame
             s3_key: S3 object key
-            format: File format ('csv', 'parquet', 'json')
+            format: File format ('parquet', 'csv', 'json')
+            transfer_config: Multipart transfer settings (optional)
             **kwargs: Additional arguments for pandas export methods
             
         Returns:
@@ -86,6 +127,7 @@ class S3Pipeline:
                 df=df,
                 s3_key=s3_key,
                 format=format,
+                transfer_config=transfer_config,
                 **kwargs
             )
             
@@ -110,3 +152,18 @@ def upload_to_s3(local_file_path: str, s3_key: Optional[str] = None) -> str:
     """
     pipeline = S3Pipeline()
     return pipeline.upload_file(local_file_path, s3_key)
+
+
+async def upload_to_s3_async(local_file_path: str, s3_key: Optional[str] = None) -> str:
+    """
+    Convenience coroutine to upload a file to S3.
+    
+    Args:
+        local_file_path: Path to local file
+        s3_key: S3 object key (optional)
+        
+    Returns:
+        S3 URI of uploaded file
+    """
+    pipeline = S3Pipeline()
+    return await pipeline.upload_file_async(local_file_path, s3_key)
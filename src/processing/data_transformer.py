@@ -11,6 +11,17 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Weekday names in calendar order, the categories of created_day_of_week
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Runs of whitespace between words: every character str.split() splits on.
+# Arrow's regex \s only matches ASCII whitespace, so the other separators are
+# listed explicitly; the escapes are resolved by Python, so the class holds
+# literal characters that both Arrow (RE2) and Python's re accept
+WORD_SEPARATOR_PATTERN = (
+    '[\\s\x0b\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+'
+)
+
 
 class DataTransformer:
     """Data transformation utilities for Reddit posts."""
@@ -34,7 +45,6 @@ class DataTransformer:
             return df
         
         logger.info(f"Transforming {len(df)} posts")
-        df = df.copy()
         
         try:
             # Type conversions
@@ -57,31 +67,52 @@ class DataTransformer:
             raise ProcessingException(f"Data transformation failed: {str(e)}")
     
     def _convert_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Convert columns to appropriate data types."""
-        # String columns
-        string_columns = ['id', 'subreddit', 'title', 'selftext', 'author', 'url', 'permalink']
-        for col in string_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(str).replace('nan', np.nan)
+        """
+        Convert columns to appropriate data types.
+        
+        The bulk astype returns a new frame, so the caller's DataFrame is
+        never modified by the transformation steps that follow.
+        """
+        # String columns: nullable Arrow-backed strings keep nulls as NA
+        string_columns = [
+            col for col in ('id', 'subreddit', 'title', 'selftext', 'author', 'url', 'permalink')
+            if col in df.columns
+        ]
+        
+        # Boolean flags: nullable booleans, missing treated as False
+        boolean_columns = [col for col in ('is_self', 'over_18', 'stickied') if col in df.columns]
+        
+        df = df.astype(
+            {col: 'string[pyarrow]' for col in string_columns}
+            | {col: 'boolean' for col in boolean_columns}
+        )
+        
+        # Few distinct subreddits per frame; store them as codes
+        if 'subreddit' in df.columns:
+            df['subreddit'] = df['subreddit'].astype('category')
+        if string_columns:
+            df[string_columns] = df[string_columns].mask(df[string_columns].eq('nan'))
+        if boolean_columns:
+            df[boolean_columns] = df[boolean_columns].fillna(False)
         
         # Numeric columns
-        numeric_columns = ['score', 'num_comments', 'upvote_ratio']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        numeric_columns = [col for col in ('score', 'num_comments', 'upvote_ratio') if col in df.columns]
+        if numeric_columns:
+            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
         
-        # Boolean columns
-        boolean_columns = ['is_self', 'over_18', 'stickied', 'distinguished']
-        for col in boolean_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(bool)
+        # distinguished holds the distinguishing role; keep only whether it is set
+        if 'distinguished' in df.columns:
+            distinguished = df['distinguished']
+            df['distinguished'] = distinguished.notna() & distinguished.astype('string').ne('')
         
         # Datetime conversion
         if 'created_utc' in df.columns:
             df['created_utc'] = pd.to_datetime(df['created_utc'], unit='s', errors='coerce')
             df['created_date'] = df['created_utc'].dt.date
             df['created_hour'] = df['created_utc'].dt.hour
-            df['created_day_of_week'] = df['created_utc'].dt.day_name()
+            df['created_day_of_week'] = pd.Categorical(
+                df['created_utc'].dt.day_name(), categories=DAY_NAMES, ordered=True
+            )
         
         return df
     
@@ -97,12 +128,12 @@ class DataTransformer:
                 if removed > 0:
                     logger.debug(f"Removed {removed} rows with missing {field}")
         
-        # Clean text fields
-        text_fields = ['title', 'selftext']
+        # Clean text fields with Arrow string kernels
+        text_fields = [field for field in ('title', 'selftext') if field in df.columns]
+        df[text_fields] = df[text_fields].astype('string[pyarrow]')
         for field in text_fields:
-            if field in df.columns:
-                df[field] = df[field].str.strip()
-                df[field] = df[field].replace('', np.nan)
+            stripped = df[field].str.strip()
+            df[field] = stripped.mask(stripped.str.len() == 0)
         
         # Handle author field (deleted/removed users)
         if 'author' in df.columns:
@@ -112,18 +143,22 @@ class DataTransformer:
     
     def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Engineer additional features."""
-        # Text length features
+        # Text length features. Text is stripped and empty text is null by now,
+        # so words are whitespace runs + 1, counted without splitting each row.
+        # Counts fit in nullable Int32, which keeps missing text as NA
         if 'title' in df.columns:
-            df['title_length'] = df['title'].str.len()
-            df['title_word_count'] = df['title'].str.split().str.len()
+            df['title_length'] = df['title'].str.len().astype('Int32')
+            df['title_word_count'] = (df['title'].str.count(WORD_SEPARATOR_PATTERN) + 1).astype('Int32')
         
         if 'selftext' in df.columns:
-            df['selftext_length'] = df['selftext'].str.len()
-            df['selftext_word_count'] = df['selftext'].str.split().str.len()
+            df['selftext_length'] = df['selftext'].str.len().astype('Int32')
+            df['selftext_word_count'] = (df['selftext'].str.count(WORD_SEPARATOR_PATTERN) + 1).astype('Int32')
         
         # Engagement metrics
         if 'score' in df.columns and 'num_comments' in df.columns:
-            df['engagement_score'] = df['score'] + (df['num_comments'] * 2)
+            df['engagement_score'] = (
+                df['score'].astype('Int32') + df['num_comments'].astype('Int32') * 2
+            )
         
         # Popularity categories
         if 'score' in df.columns:
@@ -138,10 +173,11 @@ class DataTransformer:
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicate posts based on ID."""
         if 'id' in df.columns:
-            before = len(df)
-            df = df.drop_duplicates(subset=['id'], keep='first')
-            removed = before - len(df)
+            # Hash only the id column for the row mask; skip the slice when unique
+            duplicated = df['id'].duplicated(keep='first').to_numpy()
+            removed = int(duplicated.sum())
             if removed > 0:
+                df = df[~duplicated]
                 logger.debug(f"Removed {removed} duplicate posts")
         return df
     
@@ -149,6 +185,8 @@ class DataTransformer:
         """
         Prepare DataFrame for export by handling format-specific requirements.
         
+        Nulls are preserved; CSV writers render them with to_csv(na_rep='').
+        
         Args:
             df: DataFrame to prepare
             format: Export format ('csv', 'parquet', 'json')
@@ -156,15 +194,13 @@ class DataTransformer:
         Returns:
             Prepared DataFrame
         """
-        df = df.copy()
-        
         # Convert datetime to string for CSV
         if format.lower() == 'csv':
             datetime_columns = df.select_dtypes(include=['datetime64']).columns
-            for col in datetime_columns:
-                df[col] = df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Handle NaN values
-        df = df.replace([np.nan, None], '')
+            if len(datetime_columns):
+                # Shallow copy: replace columns without touching the caller's frame
+                df = df.copy(deep=False)
+                for col in datetime_columns:
+                    df[col] = df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
         
         return df
@@ -2,6 +2,9 @@
 Production-ready data validation module with comprehensive quality checks.
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
@@ -11,6 +14,11 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Row count from which the validation aggregates are computed on a thread
+# pool. The pandas and numpy reductions they rely on release the GIL; below
+# this the thread startup costs more than it saves.
+PARALLEL_VALIDATION_MIN_ROWS = 100_000
+
 
 @dataclass
 class ValidationResult:
@@ -23,22 +31,46 @@ class ValidationResult:
     def __str__(self) -> str:
         """String representation of validation result."""
         status = "VALID" if self.is_valid else "INVALID"
-        result = f"Validation Status: {status}\n"
+        parts = [f"Validation Status: {status}"]
         if self.errors:
-            result += f"Errors ({len(self.errors)}):\n"
-            for error in self.errors:
-                result += f"  - {error}\n"
+            parts.append(f"Errors ({len(self.errors)}):")
+            parts.extend(f"  - {error}" for error in self.errors)
         if self.warnings:
-            result += f"Warnings ({len(self.warnings)}):\n"
-            for warning in self.warnings:
-                result += f"  - {warning}\n"
-        return result
+            parts.append(f"Warnings ({len(self.warnings)}):")
+            parts.extend(f"  - {warning}" for warning in self.warnings)
+        return "\n".join(parts) + "\n"
+
+
+@dataclass(frozen=True)
+class SchemaPlan:
+    """Schema-dependent validation decisions, computed once per schema."""
+    columns: frozenset
+    missing_columns: List[str]
+    unexpected_columns: List[str]
+    score_is_numeric: Optional[bool]
+    numeric_columns: List[str]
+    created_is_datetime: bool
+    title_loc: Optional[int]
+    has_title_length: bool
+
+
+@lru_cache(maxsize=None)
+def _parse_dtype(name: str):
+    """Resolve a dtype name to a dtype object, or None if pandas cannot parse it."""
+    try:
+        return pd.api.types.pandas_dtype(name)
+    except (TypeError, ValueError, NotImplementedError, AssertionError):
+        # Malformed names raise any of these depending on which dtype parser
+        # rejects them, e.g. AssertionError for 'timestamp[foo][pyarrow]'
+        return None
 
 
 class DataValidator:
     """Data validation utilities for Reddit posts."""
     
     REQUIRED_COLUMNS = ['id', 'title', 'subreddit']
+    # Numeric columns checked for negative values and, for upvote_ratio, range
+    RANGE_CHECKED_COLUMNS = ['score', 'num_comments', 'upvote_ratio']
     EXPECTED_COLUMNS = [
         'id', 'subreddit', 'title', 'selftext', 'score', 'num_comments',
         'author', 'created_utc', 'upvote_ratio', 'url', 'permalink'
@@ -48,7 +80,8 @@ class DataValidator:
         self,
         min_rows: int = 1,
         max_null_percentage: float = 50.0,
-        require_unique_ids: bool = True
+        require_unique_ids: bool = True,
+        include_distribution_stats: bool = True
     ):
         """
         Initialize data validator.
@@ -57,11 +90,15 @@ class DataValidator:
             min_rows: Minimum number of rows required
             max_null_percentage: Maximum allowed null percentage per column
             require_unique_ids: Whether IDs must be unique
+            include_distribution_stats: Whether to report per-subreddit post
+                counts in stats['subreddit_distribution']
         """
         self.min_rows = min_rows
         self.max_null_percentage = max_null_percentage
         self.require_unique_ids = require_unique_ids
+        self.include_distribution_stats = include_distribution_stats
         self.logger = logger
+        self._plans: Dict[Tuple, SchemaPlan] = {}
     
     def validate(self, df: pd.DataFrame) -> ValidationResult:
         """
@@ -78,44 +115,107 @@ class DataValidator:
         stats = {}
         
         try:
+            # Column presence and dtype decisions, reused across batches
+            plan = self._get_plan(df)
+            
             # Basic structure checks
-            structure_errors, structure_warnings, structure_stats = self._validate_structure(df)
+            structure_errors, structure_warnings, structure_stats = self._validate_structure(df, plan)
             errors.extend(structure_errors)
             warnings.extend(structure_warnings)
             stats.update(structure_stats)
             
-            # Data quality checks
-            quality_errors, quality_warnings, quality_stats = self._validate_quality(df)
-            errors.extend(quality_errors)
-            warnings.extend(quality_warnings)
-            stats.update(quality_stats)
-            
-            # Business logic checks
-            business_errors, business_warnings, business_stats = self._validate_business_rules(df)
-            errors.extend(business_errors)
-            warnings.extend(business_warnings)
-            stats.update(business_stats)
+            # An empty frame or missing required columns make the remaining
+            # checks meaningless; report the structure errors alone
+            if df.empty or plan.missing_columns:
+                return self._result(errors, warnings, stats)
             
-            is_valid = len(errors) == 0
-            
-            result = ValidationResult(
-                is_valid=is_valid,
-                errors=errors,
-                warnings=warnings,
-                stats=stats
-            )
+            # Data quality and business logic checks on the column aggregates
+            aggregates = self._compute_aggregates(df, plan)
+            for check in (self._validate_quality, self._validate_business_rules):
+                check_errors, check_warnings, check_stats = check(aggregates)
+                errors.extend(check_errors)
+                warnings.extend(check_warnings)
+                stats.update(check_stats)
             
-            logger.info(f"Validation complete: {'VALID' if is_valid else 'INVALID'} "
-                       f"({len(errors)} errors, {len(warnings)} warnings)")
-            
-            return result
+            return self._result(errors, warnings, stats)
             
         except Exception as e:
-            logger.error(f"Validation failed with exception: {str(e)}")
+            logger.error("Validation failed with exception: %s", e)
             raise DataValidationException(f"Validation failed: {str(e)}")
     
+    def accumulator(self) -> 'ValidationAccumulator':
+        """
+        Start validating a dataset that arrives in chunks.
+        
+        Returns:
+            ValidationAccumulator using this validator's settings
+        """
+        return ValidationAccumulator(self)
+    
+    def _result(self, errors: List[str], warnings: List[str], stats: Dict) -> ValidationResult:
+        """Build the ValidationResult for validate() and log its outcome."""
+        is_valid = len(errors) == 0
+        
+        result = ValidationResult(
+            is_valid=is_valid,
+            errors=errors,
+            warnings=warnings,
+            stats=stats
+        )
+        
+        logger.info("Validation complete: %s (%d errors, %d warnings)",
+                   'VALID' if is_valid else 'INVALID', len(errors), len(warnings))
+        
+        return result
+    
+    def _get_plan(self, df: pd.DataFrame) -> SchemaPlan:
+        """
+        Get the validation plan for a DataFrame's schema, building it on first use.
+        
+        Batches from the same pipeline share one schema, so the column
+        presence checks and dtype predicates run once per schema rather than
+        once per validate() call.
+        
+        Args:
+            df: DataFrame to validate
+            
+        Returns:
+            SchemaPlan for the column names and dtypes of df
+        """
+        key = (tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._build_plan(df)
+            self._plans[key] = plan
+        return plan
+    
+    def _build_plan(self, df: pd.DataFrame) -> SchemaPlan:
+        """Resolve the schema-dependent validation decisions for a DataFrame."""
+        cols = frozenset(df.columns)
+        expected_columns = frozenset(self.EXPECTED_COLUMNS)
+        dtypes = df.dtypes
+        
+        return SchemaPlan(
+            columns=cols,
+            missing_columns=[col for col in self.REQUIRED_COLUMNS if col not in cols],
+            unexpected_columns=[col for col in df.columns if col not in expected_columns],
+            score_is_numeric=pd.api.types.is_numeric_dtype(dtypes['score']) if 'score' in cols else None,
+            # Range checks skip non-numeric columns; the structure checks report them
+            numeric_columns=[
+                col for col in self.RANGE_CHECKED_COLUMNS
+                if col in cols and pd.api.types.is_numeric_dtype(dtypes[col])
+            ],
+            created_is_datetime=(
+                'created_utc' in cols and pd.api.types.is_datetime64_any_dtype(dtypes['created_utc'])
+            ),
+            title_loc=df.columns.get_loc('title') if 'title' in cols else None,
+            has_title_length=(
+                'title_length' in cols and pd.api.types.is_integer_dtype(dtypes['title_length'])
+            )
+        )
+    
     def _validate_structure(
-        self, df: pd.DataFrame
+        self, df: pd.DataFrame, plan: SchemaPlan
     ) -> Tuple[List[str], List[str], Dict]:
         """Validate DataFrame structure."""
         errors = []
@@ -131,113 +231,326 @@ class DataValidator:
         stats['total_columns'] = len(df.columns)
         
         # Check required columns
-        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
-        if missing_columns:
-            errors.append(f"Missing required columns: {missing_columns}")
+        if plan.missing_columns:
+            errors.append(f"Missing required columns: {plan.missing_columns}")
         
         # Check for unexpected columns
-        unexpected_columns = [col for col in df.columns if col not in self.EXPECTED_COLUMNS]
-        if unexpected_columns:
-            warnings.append(f"Unexpected columns found: {unexpected_columns}")
+        if plan.unexpected_columns:
+            warnings.append(f"Unexpected columns found: {plan.unexpected_columns}")
         
         # Check data types
-        if 'id' in df.columns:
+        # Object columns are inspected by value, so this stays per call
+        if 'id' in plan.columns:
             if not pd.api.types.is_string_dtype(df['id']):
                 warnings.append("Column 'id' should be string type")
         
-        if 'score' in df.columns:
-            if not pd.api.types.is_numeric_dtype(df['score']):
-                errors.append("Column 'score' should be numeric")
+        if plan.score_is_numeric is False:
+            errors.append("Column 'score' should be numeric")
         
         return errors, warnings, stats
     
-    def _validate_quality(
-        self, df: pd.DataFrame
-    ) -> Tuple[List[str], List[str], Dict]:
+    def _compute_aggregates(
+        self, df: pd.DataFrame, plan: SchemaPlan, mergeable: bool = False
+    ) -> Dict:
+        """
+        Compute the column aggregates the quality and business rule checks run on.
+        
+        Aggregates are counts, hashes and bounds, so those of separate chunks
+        merge with _merge_aggregates into the aggregates of their
+        concatenation. Large frames are measured on a thread pool.
+        
+        Args:
+            df: DataFrame to validate
+            plan: Validation plan for the schema of df
+            mergeable: Whether the aggregates will be merged, which needs the
+                per-subreddit post counts even without distribution stats
+            
+        Returns:
+            Dictionary with the row count and column names, per-column null
+            counts if there are nulls, id hashes, the empty title count,
+            negative counts of the numeric range-checked columns, the invalid
+            upvote ratio count, future-date count and bounds of created_utc,
+            the number of distinct subreddits and, if needed, per-subreddit
+            post counts
+        """
+        aggregates = {'rows': len(df), 'columns': list(df.columns)}
+        
+        null_mask = df.isna().to_numpy()
+        # any() stops at the first null; clean frames skip the column sums
+        if null_mask.any():
+            aggregates['null_counts'] = dict(zip(df.columns, null_mask.sum(axis=0).tolist()))
+        
+        measures = [
+            (self._quality_aggregates, (df, plan, null_mask)),
+            (self._business_aggregates, (df, plan, mergeable)),
+        ]
+        if len(df) >= PARALLEL_VALIDATION_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=len(measures)) as executor:
+                futures = [executor.submit(measure, *args) for measure, args in measures]
+                for future in futures:
+                    aggregates.update(future.result())
+        else:
+            for measure, args in measures:
+                aggregates.update(measure(*args))
+        
+        return aggregates
+    
+    @staticmethod
+    def _quality_aggregates(df: pd.DataFrame, plan: SchemaPlan, null_mask: np.ndarray) -> Dict:
+        """Hash the ids and count empty titles."""
+        aggregates = {}
+        
+        if 'id' in plan.columns:
+            # Hash each id to uint64 once in C; duplicates are counted on the
+            # hashes, and 64-bit collisions are negligible at batch sizes
+            aggregates['id_hashes'] = pd.util.hash_pandas_object(df['id'], index=False).to_numpy()
+        
+        # Null titles are counted by the null check. Transformed frames carry
+        # the stripped title's length in an integer title_length, so empties
+        # are an integer compare. Otherwise Arrow-backed titles are stripped
+        # and measured with Arrow kernels (nulls stay NA and are skipped), and
+        # other non-null titles are stripped with numpy's C string kernels
+        if plan.title_loc is not None:
+            titles = df['title']
+            if plan.has_title_length:
+                empty_titles = int(df['title_length'].eq(0).sum())
+            elif isinstance(titles.dtype, pd.StringDtype):
+                empty_titles = int(titles.str.strip().str.len().eq(0).sum())
+            else:
+                title_nulls = null_mask[:, plan.title_loc]
+                titles = titles.to_numpy(dtype=object)[~title_nulls].astype(str)
+                empty_titles = int((np.char.str_len(np.char.strip(titles)) == 0).sum())
+            aggregates['empty_titles'] = empty_titles
+        
+        return aggregates
+    
+    def _business_aggregates(self, df: pd.DataFrame, plan: SchemaPlan, mergeable: bool) -> Dict:
+        """Count range violations and future dates, and tally subreddits."""
+        aggregates = {}
+        
+        # Range checks on each numeric column, with 64-bit integers in their
+        # narrowest dtype. Floats keep their own dtype, since narrowing them
+        # could round values across the bounds being checked
+        negative_counts = {}
+        for col in plan.numeric_columns:
+            values = self._downcast_integers(df[col])
+            negative = values < 0
+            negative_counts[col] = int(negative.sum())
+            if col == 'upvote_ratio':
+                aggregates['invalid_ratios'] = int((negative | (values > 1)).sum())
+        aggregates['negative_counts'] = negative_counts
+        
+        if plan.created_is_datetime:
+            aggregates.update(self._date_aggregates(df['created_utc']))
+        
+        if 'subreddit' in plan.columns:
+            # Tally integer category codes instead of hashing each string
+            subreddits = df['subreddit']
+            if not isinstance(subreddits.dtype, pd.CategoricalDtype):
+                subreddits = subreddits.astype('category')
+            
+            # The checks only need the number of distinct subreddits
+            aggregates['subreddit_count'] = subreddits.nunique(dropna=True)
+            
+            if self.include_distribution_stats or mergeable:
+                subreddit_counts = subreddits.value_counts()
+                # Categorical columns also count categories with no rows left
+                aggregates['subreddit_counts'] = subreddit_counts[subreddit_counts > 0].to_dict()
+        
+        return aggregates
+    
+    @staticmethod
+    def _downcast_integers(series: pd.Series) -> pd.Series:
+        """
+        Narrow a 64-bit integer column to the smallest integer dtype that holds its values.
+        
+        The downcast is lossless. Float columns and integer columns that are
+        already narrower, such as the transformer's Int32 output, are returned
+        as-is without a copy.
+        
+        Args:
+            series: Numeric column
+            
+        Returns:
+            Column with an integer dtype of at most the input width, or the
+            input column
+        """
+        if not pd.api.types.is_integer_dtype(series.dtype) or series.dtype.itemsize < 8:
+            return series
+        return pd.to_numeric(series, downcast='integer')
+    
+    @staticmethod
+    def _merge_aggregates(total: Dict, aggregates: Dict) -> Dict:
+        """
+        Merge the aggregates of the next chunk of a dataset into its running total.
+        
+        Args:
+            total: Aggregates of the chunks so far
+            aggregates: Aggregates of the next chunk
+            
+        Returns:
+            Aggregates of all the chunks concatenated
+        """
+        merged = dict(total)
+        merged['rows'] = total['rows'] + aggregates['rows']
+        merged['columns'] = list(dict.fromkeys(total['columns'] + aggregates['columns']))
+        
+        for key in ('empty_titles', 'invalid_ratios', 'future_dates'):
+            if key in aggregates:
+                merged[key] = total.get(key, 0) + aggregates[key]
+        
+        for key in ('null_counts', 'negative_counts', 'subreddit_counts'):
+            if key in aggregates:
+                counts = Counter(total.get(key, {}))
+                counts.update(aggregates[key])
+                merged[key] = dict(counts)
+        
+        if 'subreddit_counts' in aggregates:
+            merged['subreddit_count'] = len(merged['subreddit_counts'])
+        
+        if 'id_hashes' in aggregates:
+            merged['id_hashes'] = np.concatenate(
+                [total.get('id_hashes', np.empty(0, dtype=np.uint64)), aggregates['id_hashes']]
+            )
+        
+        if 'date_bounds' in aggregates:
+            bounds = [
+                bound for bound in total.get('date_bounds', ()) + aggregates['date_bounds']
+                if bound is not pd.NaT
+            ]
+            merged['date_bounds'] = (min(bounds), max(bounds)) if bounds else (pd.NaT, pd.NaT)
+        
+        return merged
+    
+    @staticmethod
+    def _date_aggregates(created: pd.Series) -> Dict:
+        """
+        Count future dates and find the date bounds on raw int64 timestamps.
+        
+        Timestamps are compared in the column's own unit against the current
+        UTC time; NaT is excluded from the range. Timezone-aware columns are
+        compared in UTC and reported in their own timezone. Arrow-backed
+        timestamps are first converted to the numpy dtype of the same unit.
+        
+        Args:
+            created: Datetime column
+            
+        Returns:
+            Dictionary with future_dates and date_bounds, a (min, max) pair of
+            Timestamps
+        """
+        if not isinstance(created.dtype, (np.dtype, pd.DatetimeTZDtype)):
+            unit, tz = created.dt.unit, created.dt.tz
+            created = created.astype(
+                pd.DatetimeTZDtype(unit, tz) if tz is not None else f'datetime64[{unit}]'
+            )
+        
+        values = created.values
+        unit = np.datetime_data(values.dtype)[0]
+        ticks = values.view('i8')
+        now = np.datetime64('now').astype(values.dtype).view('i8')
+        
+        # NaT is the smallest int64, so it is never in the future
+        future_dates = int((ticks > now).sum())
+        
+        valid = ~np.isnat(values)
+        if not valid.any():
+            return {'future_dates': future_dates, 'date_bounds': (pd.NaT, pd.NaT)}
+        
+        bounds = (
+            ticks.min(where=valid, initial=np.iinfo(np.int64).max),
+            ticks.max(where=valid, initial=np.iinfo(np.int64).min)
+        )
+        timestamps = [pd.Timestamp(np.datetime64(int(tick), unit)) for tick in bounds]
+        tz = getattr(created.dtype, 'tz', None)
+        if tz is not None:
+            timestamps = [timestamp.tz_localize('UTC').tz_convert(tz) for timestamp in timestamps]
+        
+        return {'future_dates': future_dates, 'date_bounds': tuple(timestamps)}
+    
+    def _validate_quality(self, aggregates: Dict) -> Tuple[List[str], List[str], Dict]:
         """Validate data quality."""
         errors = []
         warnings = []
         stats = {}
+        rows = aggregates['rows']
         
         # Check minimum rows
-        if len(df) < self.min_rows:
-            errors.append(f"DataFrame has {len(df)} rows, minimum required is {self.min_rows}")
+        if rows < self.min_rows:
+            errors.append(f"DataFrame has {rows} rows, minimum required is {self.min_rows}")
         
         # Check for duplicates
-        if 'id' in df.columns:
-            duplicate_count = df['id'].duplicated().sum()
-            stats['duplicate_ids'] = int(duplicate_count)
+        if 'id_hashes' in aggregates:
+            hashes = aggregates['id_hashes']
+            duplicate_count = len(hashes) - np.unique(hashes).size
+            stats['duplicate_ids'] = duplicate_count
             if duplicate_count > 0 and self.require_unique_ids:
                 errors.append(f"Found {duplicate_count} duplicate IDs")
             elif duplicate_count > 0:
                 warnings.append(f"Found {duplicate_count} duplicate IDs")
         
         # Check null percentages
-        null_percentages = (df.isnull().sum() / len(df) * 100).to_dict()
+        if 'null_counts' in aggregates:
+            null_counts = aggregates['null_counts']
+            null_percentages = {
+                col: null_counts.get(col, 0) / rows * 100 for col in aggregates['columns']
+            }
+            
+            for col, pct in null_percentages.items():
+                if pct > self.max_null_percentage:
+                    errors.append(f"Column '{col}' has {pct:.2f}% null values (max allowed: {self.max_null_percentage}%)")
+                elif pct > self.max_null_percentage / 2:
+                    warnings.append(f"Column '{col}' has {pct:.2f}% null values")
+        else:
+            null_percentages = dict.fromkeys(aggregates['columns'], 0.0)
         stats['null_percentages'] = null_percentages
         
-        for col, pct in null_percentages.items():
-            if pct > self.max_null_percentage:
-                errors.append(f"Column '{col}' has {pct:.2f}% null values (max allowed: {self.max_null_percentage}%)")
-            elif pct > self.max_null_percentage / 2:
-                warnings.append(f"Column '{col}' has {pct:.2f}% null values")
-        
         # Check for empty strings in critical fields
-        if 'title' in df.columns:
-            empty_titles = (df['title'].astype(str).str.strip() == '').sum()
-            if empty_titles > 0:
-                errors.append(f"Found {empty_titles} posts with empty titles")
+        if aggregates.get('empty_titles', 0) > 0:
+            errors.append(f"Found {aggregates['empty_titles']} posts with empty titles")
         
         return errors, warnings, stats
     
-    def _validate_business_rules(
-        self, df: pd.DataFrame
-    ) -> Tuple[List[str], List[str], Dict]:
+    def _validate_business_rules(self, aggregates: Dict) -> Tuple[List[str], List[str], Dict]:
         """Validate business logic rules."""
         errors = []
         warnings = []
         stats = {}
         
+        negative_counts = aggregates['negative_counts']
+        
         # Check score ranges
-        if 'score' in df.columns:
-            negative_scores = (df['score'] < 0).sum()
-            stats['negative_scores'] = int(negative_scores)
-            if negative_scores > len(df) * 0.1:  # More than 10% negative
+        if 'score' in negative_counts:
+            negative_scores = negative_counts['score']
+            stats['negative_scores'] = negative_scores
+            if negative_scores > aggregates['rows'] * 0.1:  # More than 10% negative
                 warnings.append(f"High percentage of negative scores: {negative_scores}")
         
         # Check comment counts
-        if 'num_comments' in df.columns:
-            negative_comments = (df['num_comments'] < 0).sum()
-            if negative_comments > 0:
-                errors.append(f"Found {negative_comments} posts with negative comment counts")
+        if negative_counts.get('num_comments', 0) > 0:
+            errors.append(f"Found {negative_counts['num_comments']} posts with negative comment counts")
         
         # Check upvote ratio
-        if 'upvote_ratio' in df.columns:
-            invalid_ratios = ((df['upvote_ratio'] < 0) | (df['upvote_ratio'] > 1)).sum()
-            if invalid_ratios > 0:
-                errors.append(f"Found {invalid_ratios} posts with invalid upvote ratios")
+        if aggregates.get('invalid_ratios', 0) > 0:
+            errors.append(f"Found {aggregates['invalid_ratios']} posts with invalid upvote ratios")
         
         # Check date ranges
-        if 'created_utc' in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df['created_utc']):
-                future_dates = (df['created_utc'] > pd.Timestamp.now()).sum()
-                if future_dates > 0:
-                    errors.append(f"Found {future_dates} posts with future dates")
-                
-                stats['date_range'] = {
-                    'min': str(df['created_utc'].min()),
-                    'max': str(df['created_utc'].max())
-                }
+        if 'date_bounds' in aggregates:
+            if aggregates['future_dates'] > 0:
+                errors.append(f"Found {aggregates['future_dates']} posts with future dates")
+            
+            date_min, date_max = aggregates['date_bounds']
+            stats['date_range'] = {'min': str(date_min), 'max': str(date_max)}
         
         # Check subreddit distribution
-        if 'subreddit' in df.columns:
-            subreddit_counts = df['subreddit'].value_counts().to_dict()
-            stats['subreddit_distribution'] = subreddit_counts
-            
-            if len(subreddit_counts) == 0:
+        if 'subreddit_count' in aggregates:
+            if aggregates['subreddit_count'] == 0:
                 errors.append("No subreddits found in data")
-            elif len(subreddit_counts) == 1:
+            elif aggregates['subreddit_count'] == 1:
                 warnings.append("Data contains posts from only one subreddit")
+            
+            if self.include_distribution_stats:
+                stats['subreddit_distribution'] = aggregates['subreddit_counts']
         
         return errors, warnings, stats
     
@@ -255,15 +568,16 @@ class DataValidator:
         errors = []
         warnings = []
         stats = {}
+        dtypes = df.dtypes
         
         for col, expected_type in expected_schema.items():
-            if col not in df.columns:
+            if col not in dtypes.index:
                 errors.append(f"Missing column: {col}")
                 continue
             
-            actual_type = str(df[col].dtype)
-            if expected_type not in actual_type:
-                warnings.append(f"Column '{col}' has type {actual_type}, expected {expected_type}")
+            actual_dtype = dtypes[col]
+            if not self._dtype_matches(actual_dtype, expected_type):
+                warnings.append(f"Column '{col}' has type {actual_dtype}, expected {expected_type}")
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -271,3 +585,121 @@ class DataValidator:
             warnings=warnings,
             stats=stats
         )
+    
+    @staticmethod
+    def _dtype_matches(actual_dtype, expected_type: str) -> bool:
+        """
+        Check a column dtype against an expected dtype name.
+        
+        NumPy dtypes must match exactly. Extension dtypes (nullable integers,
+        strings, categoricals) match on dtype kind, so 'int64' accepts Int64 and
+        'object' accepts Arrow-backed strings. Names pandas cannot parse, such
+        as 'datetime', fall back to a substring match on the dtype name.
+        
+        Args:
+            actual_dtype: Column dtype
+            expected_type: Expected dtype name
+            
+        Returns:
+            True if the dtype matches
+        """
+        expected_dtype = _parse_dtype(expected_type)
+        if expected_dtype is None:
+            return expected_type in str(actual_dtype)
+        
+        if actual_dtype == expected_dtype:
+            return True
+        if isinstance(actual_dtype, np.dtype) and isinstance(expected_dtype, np.dtype):
+            return False
+        return actual_dtype.kind == expected_dtype.kind
+
+
+class ValidationAccumulator:
+    """
+    Validate a dataset chunk by chunk without keeping the chunks.
+    
+    Each chunk is reduced to the validator's column aggregates (row and null
+    counts, id hashes, range check counts, date bounds, subreddit counts) as
+    it is added, and result() runs the quality and business rule checks on
+    the merged aggregates, so the checks see the whole dataset as validate()
+    would on the concatenated chunks.
+    """
+    
+    def __init__(self, validator: DataValidator):
+        """
+        Initialize an empty accumulator.
+        
+        Args:
+            validator: Validator whose settings and checks are used
+        """
+        self.validator = validator
+        self._errors: Dict[str, None] = {}
+        self._warnings: Dict[str, None] = {}
+        self._rows = 0
+        self._columns: Dict[str, None] = {}
+        self._missing_columns = False
+        self._aggregates: Optional[Dict] = None
+    
+    def add(self, df: pd.DataFrame) -> None:
+        """
+        Add the next chunk of the dataset. Empty chunks are skipped.
+        
+        Args:
+            df: DataFrame chunk
+        """
+        if df.empty:
+            return
+        
+        try:
+            plan = self.validator._get_plan(df)
+            
+            # Structure messages depend only on the schema; report each once
+            structure_errors, structure_warnings, _ = self.validator._validate_structure(df, plan)
+            self._errors.update(dict.fromkeys(structure_errors))
+            self._warnings.update(dict.fromkeys(structure_warnings))
+            self._rows += len(df)
+            self._columns.update(dict.fromkeys(df.columns))
+            if plan.missing_columns:
+                self._missing_columns = True
+                return
+            
+            aggregates = self.validator._compute_aggregates(df, plan, mergeable=True)
+        except Exception as e:
+            logger.error("Validation failed with exception: %s", e)
+            raise DataValidationException(f"Validation failed: {str(e)}")
+        
+        if self._aggregates is None:
+            self._aggregates = aggregates
+        else:
+            self._aggregates = self.validator._merge_aggregates(self._aggregates, aggregates)
+    
+    def result(self) -> ValidationResult:
+        """
+        Validate the chunks added so far as one dataset.
+        
+        Returns:
+            ValidationResult object
+        """
+        errors = list(self._errors)
+        warnings = list(self._warnings)
+        stats = {}
+        
+        if self._rows == 0:
+            errors.append("DataFrame is empty")
+            return self.validator._result(errors, warnings, stats)
+        
+        stats['total_rows'] = self._rows
+        stats['total_columns'] = len(self._columns)
+        
+        # As in validate(), missing required columns make the remaining
+        # checks meaningless
+        if self._missing_columns:
+            return self.validator._result(errors, warnings, stats)
+        
+        for check in (self.validator._validate_quality, self.validator._validate_business_rules):
+            check_errors, check_warnings, check_stats = check(self._aggregates)
+            errors.extend(check_errors)
+            warnings.extend(check_warnings)
+            stats.update(check_stats)
+        
+        return self.validator._result(errors, warnings, stats)
@@ -13,6 +13,31 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Environment variable that overrides each (section, key) config file entry
+ENV_VARS = {
+    ("api_keys", "reddit_client_id"): "REDDIT_CLIENT_ID",
+    ("api_keys", "reddit_secret_key"): "REDDIT_SECRET_KEY",
+    ("api_keys", "reddit_user_agent"): "REDDIT_USER_AGENT",
+    ("api_keys", "reddit_ratelimit_seconds"): "REDDIT_RATELIMIT_SECONDS",
+    ("aws", "aws_access_key_id"): "AWS_ACCESS_KEY_ID",
+    ("aws", "aws_secret_access_key"): "AWS_SECRET_ACCESS_KEY",
+    ("aws", "aws_region"): "AWS_REGION",
+    ("aws", "aws_bucket_name"): "AWS_BUCKET_NAME",
+    ("aws", "aws_session_token"): "AWS_SESSION_TOKEN",
+    ("aws", "aws_tune_http_blocksize"): "AWS_TUNE_HTTP_BLOCKSIZE",
+    ("database", "database_host"): "DB_HOST",
+    ("database", "database_port"): "DB_PORT",
+    ("database", "database_name"): "DB_NAME",
+    ("database", "database_username"): "DB_USER",
+    ("database", "database_password"): "DB_PASSWORD",
+    ("etl_settings", "batch_size"): "BATCH_SIZE",
+    ("etl_settings", "max_retries"): "MAX_RETRIES",
+    ("etl_settings", "retry_delay"): "RETRY_DELAY",
+    ("etl_settings", "timeout"): "TIMEOUT",
+    ("etl_settings", "log_level"): "LOG_LEVEL",
+    ("etl_settings", "data_quality_checks"): "DATA_QUALITY_CHECKS",
+}
+
 
 @dataclass
 class RedditConfig:
@@ -20,6 +45,7 @@ class RedditConfig:
     client_id: str
     client_secret: str
     user_agent: str = "RedditDataPipeline/1.0"
+    ratelimit_seconds: int = 60
     
     def __post_init__(self):
         if not self.client_id or not self.client_secret:
@@ -34,6 +60,7 @@ class AWSConfig:
     region: str = "us-east-1"
     bucket_name: str = ""
     session_token: Optional[str] = None
+    tune_http_blocksize: bool = False
     
     def __post_init__(self):
         if not self.access_key_id or not self.secret_access_key:
@@ -101,48 +128,56 @@ class AppConfig:
         parser = configparser.ConfigParser()
         if config_path.exists():
             parser.read(config_path)
-            logger.info(f"Loaded configuration from {config_path}")
+            logger.info("Loaded configuration from %s", config_path)
         else:
-            logger.warning(f"Config file not found at {config_path}, using environment variables only")
+            logger.warning("Config file not found at %s, using environment variables only", config_path)
+        
+        # Config file sections, read into dicts on first use
+        sections: Dict[str, Dict[str, str]] = {}
         
         # Helper function to get config with env var override
         def get_config(section: str, key: str, default: str = "") -> str:
-            env_key = f"{section.upper()}_{key.upper()}"
-            return os.getenv(env_key, parser.get(section, key, fallback=default))
+            env_value = os.getenv(ENV_VARS[(section, key)])
+            if env_value:
+                return env_value
+            if section not in sections:
+                sections[section] = dict(parser.items(section)) if parser.has_section(section) else {}
+            return sections[section].get(key, default)
         
         # Reddit config
         reddit_config = RedditConfig(
-            client_id=get_config("api_keys", "reddit_client_id") or os.getenv("REDDIT_CLIENT_ID", ""),
-            client_secret=get_config("api_keys", "reddit_secret_key") or os.getenv("REDDIT_SECRET_KEY", ""),
-            user_agent=get_config("api_keys", "reddit_user_agent", "RedditDataPipeline/1.0") 
-                      or os.getenv("REDDIT_USER_AGENT", "RedditDataPipeline/1.0")
+            client_id=get_config("api_keys", "reddit_client_id"),
+            client_secret=get_config("api_keys", "reddit_secret_key"),
+            user_agent=get_config("api_keys", "reddit_user_agent", "RedditDataPipeline/1.0"),
+            ratelimit_seconds=int(get_config("api_keys", "reddit_ratelimit_seconds", "60"))
         )
         
         # AWS config
         aws_config = AWSConfig(
-            access_key_id=get_config("aws", "aws_access_key_id") or os.getenv("AWS_ACCESS_KEY_ID", ""),
-            secret_access_key=get_config("aws", "aws_secret_access_key") or os.getenv("AWS_SECRET_ACCESS_KEY", ""),
-            region=get_config("aws", "aws_region", "us-east-1") or os.getenv("AWS_REGION", "us-east-1"),
-            bucket_name=get_config("aws", "aws_bucket_name") or os.getenv("AWS_BUCKET_NAME", ""),
-            session_token=get_config("aws", "aws_session_token") or os.getenv("AWS_SESSION_TOKEN")
+            access_key_id=get_config("aws", "aws_access_key_id"),
+            secret_access_key=get_config("aws", "aws_secret_access_key"),
+            region=get_config("aws", "aws_region", "us-east-1"),
+            bucket_name=get_config("aws", "aws_bucket_name"),
+            session_token=get_config("aws", "aws_session_token") or None,
+            tune_http_blocksize=get_config("aws", "aws_tune_http_blocksize", "false").lower() == "true"
         )
         
         # Database config
         database_config = DatabaseConfig(
-            host=get_config("database", "database_host", "localhost") or os.getenv("DB_HOST", "localhost"),
-            port=int(get_config("database", "database_port", "5432") or os.getenv("DB_PORT", "5432")),
-            name=get_config("database", "database_name", "airflow_reddit") or os.getenv("DB_NAME", "airflow_reddit"),
-            username=get_config("database", "database_username", "postgres") or os.getenv("DB_USER", "postgres"),
-            password=get_config("database", "database_password", "postgres") or os.getenv("DB_PASSWORD", "postgres")
+            host=get_config("database", "database_host", "localhost"),
+            port=int(get_config("database", "database_port", "5432")),
+            name=get_config("database", "database_name", "airflow_reddit"),
+            username=get_config("database", "database_username", "postgres"),
+            password=get_config("database", "database_password", "postgres")
         )
         
         # Pipeline config
         pipeline_config = PipelineConfig(
-            batch_size=int(get_config("etl_settings", "batch_size", "1000") or os.getenv("BATCH_SIZE", "1000")),
-            max_retries=int(get_config("etl_settings", "max_retries", "3") or os.getenv("MAX_RETRIES", "3")),
-            retry_delay=int(get_config("etl_settings", "retry_delay", "5") or os.getenv("RETRY_DELAY", "5")),
-            timeout=int(get_config("etl_settings", "timeout", "300") or os.getenv("TIMEOUT", "300")),
-            log_level=get_config("etl_settings", "log_level", "INFO") or os.getenv("LOG_LEVEL", "INFO"),
+            batch_size=int(get_config("etl_settings", "batch_size", "1000")),
+            max_retries=int(get_config("etl_settings", "max_retries", "3")),
+            retry_delay=int(get_config("etl_settings", "retry_delay", "5")),
+            timeout=int(get_config("etl_settings", "timeout", "300")),
+            log_level=get_config("etl_settings", "log_level", "INFO"),
             data_quality_checks=get_config("etl_settings", "data_quality_checks", "true").lower() == "true"
         )
         
@@ -2,24 +2,94 @@
 Production-ready logging configuration for the Reddit Data Pipeline.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import warnings
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+# Formatters shared by every handler the pipeline creates
+_CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 
 class PipelineLogger:
     """Centralized logging utility for the pipeline."""
     
-    _loggers: dict[str, logging.Logger] = {}
     _log_dir = Path("logs")
+    _log_file_prefix = "pipeline"
+    _queue_handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
+    _console_handler: Optional[logging.Handler] = None
+    _lock = threading.Lock()
     
     @classmethod
     def setup_log_dir(cls) -> None:
         """Create logs directory if it doesn't exist."""
         cls._log_dir.mkdir(exist_ok=True)
     
+    @classmethod
+    def _get_queue_handler(cls) -> QueueHandler:
+        """
+        Get the queue handler feeding the log directory's file, starting its writer on first use.
+        
+        Every pipeline logger writes to one daily file through one queue. A
+        single QueueListener thread owns the only FileHandler, so file I/O
+        stays off the caller's path and one file descriptor is open no matter
+        how many modules log. The listener is stopped at exit, flushing any
+        queued records.
+        
+        Returns:
+            QueueHandler shared by every pipeline logger
+        """
+        if cls._queue_handler is None:
+            cls.setup_log_dir()
+            log_file_path = cls._log_dir / f"{cls._log_file_prefix}_{datetime.now().strftime('%Y%m%d')}.log"
+            
+            file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_FILE_FORMATTER)
+            
+            log_queue = queue.Queue(-1)
+            cls._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            cls._listener.start()
+            atexit.register(cls._stop_listener)
+            
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(logging.DEBUG)
+            cls._queue_handler = queue_handler
+        return cls._queue_handler
+    
+    @classmethod
+    def _stop_listener(cls) -> None:
+        """Flush queued records and stop the file writer thread."""
+        if cls._listener is not None:
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.close()
+            cls._listener = None
+    
+    @classmethod
+    def _get_console_handler(cls) -> logging.Handler:
+        """Get the stdout handler shared by every pipeline logger."""
+        if cls._console_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            cls._console_handler = console_handler
+        return cls._console_handler
+    
     @classmethod
     def get_logger(
         cls,
@@ -31,51 +101,45 @@ class PipelineLogger:
         """
         Get or create a logger instance.
         
+        logging.getLogger already returns one logger per name; handlers and
+        level are only configured the first time a name is requested. All
+        loggers share one console handler and one queued file handler.
+        
         Args:
             name: Logger name (typically __name__)
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_to_file: Whether to log to file
-            log_file_prefix: Optional prefix for log file name
+            log_file_prefix: Deprecated and ignored; all loggers write to the
+                log directory's shared daily file
             
         Returns:
             Configured logger instance
         """
-        if name in cls._loggers:
-            return cls._loggers[name]
+        if log_file_prefix is not None:
+            warnings.warn(
+                "log_file_prefix is deprecated and ignored; all loggers share one log file",
+                DeprecationWarning,
+                stacklevel=2
+            )
         
         logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, log_level.upper()))
         
-        # Prevent duplicate handlers
+        # Already configured; prevent duplicate handlers
         if logger.handlers:
             return logger
         
-        # Console handler with colored output
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
-        
-        # File handler
-        if log_to_file:
-            cls.setup_log_dir()
-            log_file_name = log_file_prefix or name.replace('.', '_')
-            log_file_path = cls._log_dir / f"{log_file_name}_{datetime.now().strftime('%Y%m%d')}.log"
+        with cls._lock:
+            # Another thread may have configured it while we waited
+            if logger.handlers:
+                return logger
             
-            file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)
-            file_format = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(file_format)
-            logger.addHandler(file_handler)
+            logger.setLevel(getattr(logging, log_level.upper()))
+            logger.addHandler(cls._get_console_handler())
+            
+            # Shared log file, written asynchronously through a queue
+            if log_to_file:
+                logger.addHandler(cls._get_queue_handler())
         
-        cls._loggers[name] = logger
         return logger
 
 
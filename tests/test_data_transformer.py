@@ -5,7 +5,7 @@ Unit tests for data transformer.
 import unittest
 import pandas as pd
 import numpy as np
-from src.processing.data_transformer import DataTransformer
+from src.processing.data_transformer import DataTransformer, DAY_NAMES
 
 
 class TestDataTransformer(unittest.TestCase):
@@ -56,6 +56,49 @@ class TestDataTransformer(unittest.TestCase):
         self.assertIn('title_length', result.columns)
         self.assertIn('title_word_count', result.columns)
         self.assertIn('engagement_score', result.columns)
+    
+    def test_transform_dtypes(self):
+        """Test the dtypes of transformed columns."""
+        df = pd.DataFrame({
+            'id': ['1', '2'],
+            'title': ['Test Title', 'Another  Title'],
+            'selftext': ['Body', None],
+            'subreddit': ['test', 'test'],
+            'score': [10, 20],
+            'num_comments': [5, 10],
+            'created_utc': [1609459200, 1609545600],
+            'is_self': [True, None],
+            'distinguished': [None, 'moderator']
+        })
+        
+        result = self.transformer.transform_reddit_posts(df)
+        
+        day_of_week = result['created_day_of_week']
+        self.assertIsInstance(day_of_week.dtype, pd.CategoricalDtype)
+        self.assertTrue(day_of_week.cat.ordered)
+        self.assertEqual(list(day_of_week.cat.categories), DAY_NAMES)
+        self.assertEqual(day_of_week.tolist(), ['Friday', 'Saturday'])
+        
+        self.assertEqual(result['is_self'].dtype, 'boolean')
+        self.assertEqual(result['is_self'].tolist(), [True, False])
+        self.assertEqual(result['distinguished'].dtype, 'boolean')
+        self.assertEqual(result['distinguished'].tolist(), [False, True])
+        
+        for col in ('title_length', 'title_word_count', 'selftext_length', 'engagement_score'):
+            self.assertEqual(result[col].dtype, 'Int32')
+        self.assertEqual(result['title_word_count'].tolist(), [2, 2])
+        self.assertTrue(pd.isna(result['selftext_length'].iloc[1]))
+        self.assertEqual(result['engagement_score'].tolist(), [20, 40])
+        self.assertIsInstance(result['subreddit'].dtype, pd.CategoricalDtype)
+    
+    def test_word_count_unicode_whitespace(self):
+        """Test word counts split on non-ASCII whitespace like str.split()."""
+        titles = ['a\u00a0b', 'a\u3000b c', 'one\u2009two\u2028three', 'single']
+        df = pd.DataFrame({'title': pd.array(titles, dtype='string[pyarrow]')})
+        
+        result = self.transformer._engineer_features(df)
+        
+        self.assertEqual(result['title_word_count'].tolist(), [len(title.split()) for title in titles])
 
 
 if __name__ == '__main__':
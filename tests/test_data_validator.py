@@ -77,6 +77,143 @@ class TestDataValidator(unittest.TestCase):
         
         result = self.validator.validate_schema(df, expected_schema)
         self.assertTrue(result.is_valid)
+    
+    def test_validate_arrow_timestamps(self):
+        """Test date checks on Arrow-backed timestamp columns."""
+        created = pd.Series(
+            pd.to_datetime(['2021-01-01', '2022-01-01', None, '2200-01-01'])
+        ).astype('timestamp[s][pyarrow]')
+        df = pd.DataFrame({
+            'id': ['1', '2', '3', '4'],
+            'title': ['Title 1', 'Title 2', 'Title 3', 'Title 4'],
+            'subreddit': ['test', 'test', 'test', 'other'],
+            'created_utc': created
+        })
+        
+        result = self.validator.validate(df)
+        
+        self.assertIn('Found 1 posts with future dates', result.errors)
+        self.assertEqual(result.stats['date_range']['min'], '2021-01-01 00:00:00')
+        self.assertEqual(result.stats['date_range']['max'], '2200-01-01 00:00:00')
+    
+    def test_accumulator_matches_validate(self):
+        """Test chunked validation against validating the concatenated chunks."""
+        chunks = [
+            pd.DataFrame({
+                'id': ['1', '2'],
+                'title': ['Title 1', ' '],
+                'subreddit': ['python', 'python'],
+                'score': [10, -5],
+                'selftext': [None, 'text']
+            }),
+            pd.DataFrame({
+                'id': ['2', '3'],
+                'title': ['Title 2', 'Title 3'],
+                'subreddit': ['learnpython', 'learnpython'],
+                'score': [20, 30],
+                'selftext': [None, None]
+            })
+        ]
+        
+        accumulator = self.validator.accumulator()
+        for chunk in chunks:
+            accumulator.add(chunk)
+        result = accumulator.result()
+        expected = self.validator.validate(pd.concat(chunks, ignore_index=True))
+        
+        self.assertEqual(result.errors, expected.errors)
+        self.assertEqual(result.warnings, expected.warnings)
+        self.assertEqual(result.stats, expected.stats)
+        self.assertIn('Found 1 duplicate IDs', result.errors)
+        self.assertEqual(result.stats['null_percentages']['selftext'], 75.0)
+    
+    def test_validate_nullable_arrow_and_categorical_dtypes(self):
+        """Test validation of nullable, Arrow-backed and categorical columns."""
+        df = pd.DataFrame({
+            'id': pd.array(['1', '2', '2', '4'], dtype='string[pyarrow]'),
+            'title': pd.array(['Title 1', ' ', None, 'Title 4'], dtype='string[pyarrow]'),
+            'subreddit': pd.Categorical(['python', 'python', 'learnpython', 'python'],
+                                        categories=['python', 'learnpython', 'unused']),
+            'score': pd.array([10, -5, None, 30], dtype='Int32'),
+            'num_comments': pd.array([1, 2, 3, -1], dtype='Int32'),
+            'upvote_ratio': np.array([0.5, 1.0, 0.9, 1.5], dtype='float32')
+        })
+        
+        result = self.validator.validate(df)
+        
+        self.assertEqual(result.errors, [
+            'Found 1 duplicate IDs',
+            'Found 1 posts with empty titles',
+            'Found 1 posts with negative comment counts',
+            'Found 1 posts with invalid upvote ratios'
+        ])
+        self.assertEqual(result.stats['null_percentages']['title'], 25.0)
+        self.assertEqual(result.stats['null_percentages']['score'], 25.0)
+        self.assertEqual(result.stats['negative_scores'], 1)
+        self.assertEqual(result.stats['subreddit_distribution'], {'python': 3, 'learnpython': 1})
+    
+    def test_validate_empty_titles_from_title_length(self):
+        """Test the empty-title check on frames with and without title_length."""
+        df = pd.DataFrame({
+            'id': ['1', '2', '3'],
+            'title': ['Title 1', '  ', None],
+            'subreddit': ['test', 'test', 'other']
+        })
+        with_length = df.assign(title_length=pd.array([7, 0, None], dtype='Int32'))
+        
+        for frame in (df, with_length):
+            result = self.validator.validate(frame)
+            self.assertIn('Found 1 posts with empty titles', result.errors)
+    
+    def test_range_checks_keep_values(self):
+        """Test range checks on downcast integers and full-precision floats."""
+        df = pd.DataFrame({
+            'id': ['1', '2', '3'],
+            'title': ['Title 1', 'Title 2', 'Title 3'],
+            'subreddit': ['test', 'test', 'other'],
+            'num_comments': np.array([2**40, -1, 0], dtype='int64'),
+            'upvote_ratio': [0.5, 1.0000000001, 1.0]
+        })
+        
+        result = self.validator.validate(df)
+        
+        self.assertIn('Found 1 posts with negative comment counts', result.errors)
+        self.assertIn('Found 1 posts with invalid upvote ratios', result.errors)
+    
+    def test_validate_without_distribution_stats(self):
+        """Test subreddit checks when distribution stats are not requested."""
+        validator = DataValidator(include_distribution_stats=False)
+        chunks = [
+            pd.DataFrame({'id': ['1'], 'title': ['Title 1'], 'subreddit': ['python']}),
+            pd.DataFrame({'id': ['2'], 'title': ['Title 2'], 'subreddit': ['learnpython']})
+        ]
+        
+        result = validator.validate(chunks[0])
+        self.assertIn('Data contains posts from only one subreddit', result.warnings)
+        self.assertNotIn('subreddit_distribution', result.stats)
+        
+        accumulator = validator.accumulator()
+        for chunk in chunks:
+            accumulator.add(chunk)
+        result = accumulator.result()
+        self.assertEqual(result.warnings, [])
+        self.assertNotIn('subreddit_distribution', result.stats)
+    
+    def test_validate_schema_invalid_dtype_names(self):
+        """Test unparseable expected dtypes are reported as mismatches."""
+        df = pd.DataFrame({
+            'id': ['1', '2'],
+            'score': [10, 20]
+        })
+        
+        expected_schema = {
+            'id': 'timestamp[foo][pyarrow]',
+            'score': 'decimal(1)[pyarrow]'
+        }
+        
+        result = self.validator.validate_schema(df, expected_schema)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(len(result.warnings), 2)
 
 
 if __name__ == '__main__':
@@ -3,8 +3,10 @@ Unit tests for Reddit extractor.
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
+import pyarrow as pa
 from src.ingestion.reddit_extractor import RedditExtractor
 from src.utils.exceptions import RedditAPIException
 
@@ -71,6 +73,86 @@ class TestRedditExtractor(unittest.TestCase):
         self.assertIn('id', result)
         self.assertEqual(result['id'], 'test_id')
         self.assertEqual(result['title'], 'Test Title')
+        self.assertEqual(result['author'], 'test_author')
+        self.assertEqual(result['created_utc'], 1609459200)
+        self.assertEqual(set(result), set(RedditExtractor.POST_FIELDS))
+    
+    def make_extractor(self, mock_reddit_class):
+        """Create an extractor on a mocked PRAW client."""
+        mock_reddit_class.return_value = MagicMock()
+        return RedditExtractor(config={
+            'client_id': 'test_id',
+            'client_secret': 'test_secret',
+            'user_agent': 'test_agent'
+        })
+    
+    @staticmethod
+    def make_post(post_id, subreddit='python'):
+        """Create a submission stand-in with every extracted field."""
+        return SimpleNamespace(
+            id=post_id, subreddit=subreddit, title=f'Title {post_id}', selftext='',
+            score=10, num_comments=2, author='test_author', created_utc=1609459200.0,
+            upvote_ratio=0.9, url='https://example.com', permalink=f'/r/{subreddit}/{post_id}',
+            is_self=True, over_18=False, stickied=False, distinguished=None
+        )
+    
+    @patch('src.ingestion.reddit_extractor.praw.Reddit')
+    def test_extract_record_batches(self, mock_reddit_class):
+        """Test posts are split into record batches with the post schema."""
+        extractor = self.make_extractor(mock_reddit_class)
+        posts = [self.make_post(str(i)) for i in range(5)]
+        
+        with patch.object(extractor, '_get_listing', return_value=iter(posts)):
+            batches = extractor.extract_record_batches('python', batch_rows=2)
+        
+        self.assertEqual([batch.num_rows for batch in batches], [2, 2, 1])
+        self.assertTrue(all(batch.schema.equals(RedditExtractor.POST_SCHEMA) for batch in batches))
+        table = pa.Table.from_batches(batches)
+        self.assertEqual(table.column('id').to_pylist(), ['0', '1', '2', '3', '4'])
+        self.assertEqual(table.column('created_utc').to_pylist(), [1609459200] * 5)
+    
+    @patch('src.ingestion.reddit_extractor.praw.Reddit')
+    def test_iter_record_batches_dedups_subreddits(self, mock_reddit_class):
+        """Test repeated subreddit names are extracted once and empty ones skipped."""
+        extractor = self.make_extractor(mock_reddit_class)
+        batch = extractor._to_record_batch([[value] for value in extractor._extract_post_values(self.make_post('a'))])
+        extractor.extract_record_batches = Mock(
+            side_effect=lambda subreddit, **kwargs: [batch] if subreddit == 'python' else []
+        )
+        
+        batches = list(extractor.iter_record_batches(['python', 'Python', 'empty'], max_workers=1))
+        
+        self.assertEqual(batches, [batch])
+        extracted = sorted(call.kwargs['subreddit'] for call in extractor.extract_record_batches.call_args_list)
+        self.assertEqual(extracted, ['empty', 'python'])
+    
+    @patch('src.ingestion.reddit_extractor.praw.Reddit')
+    def test_iter_dataframes_dedups_subreddits(self, mock_reddit_class):
+        """Test iter_dataframes extracts repeated subreddit names once."""
+        extractor = self.make_extractor(mock_reddit_class)
+        
+        listing = Mock(side_effect=lambda *args: iter([self.make_post('a')]))
+        
+        with patch.object(extractor, '_get_listing', listing):
+            chunks = list(extractor.iter_dataframes(['python', 'PYTHON']))
+        
+        self.assertEqual(listing.call_count, 1)
+        self.assertEqual(len(chunks), 1)
+        subreddit, df = chunks[0]
+        self.assertEqual(subreddit, 'python')
+        self.assertEqual(df['id'].tolist(), ['a'])
+        self.assertEqual(df['score'].dtype, 'Int32')
+    
+    @patch('src.ingestion.reddit_extractor.praw.Reddit')
+    def test_extract_posts_batch_delay_is_deprecated(self, mock_reddit_class):
+        """Test the ignored delay_between_subreddits argument warns."""
+        extractor = self.make_extractor(mock_reddit_class)
+        
+        with patch.object(extractor, '_get_listing', side_effect=lambda *args: iter([self.make_post('a')])):
+            with self.assertWarns(DeprecationWarning):
+                df = extractor.extract_posts_batch(['python'], delay_between_subreddits=1.0)
+        
+        self.assertEqual(len(df), 1)
 
 
 if __name__ == '__main__':
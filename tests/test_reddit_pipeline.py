@@ -0,0 +1,97 @@
+"""
+Unit tests for Reddit pipeline.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import pyarrow.parquet as pq
+from src.pipelines.reddit_pipeline import RedditPipeline
+from src.utils.exceptions import RedditPipelineException
+
+
+def make_posts(subreddit, ids, num_comments=5):
+    """Build a raw extracted DataFrame for one subreddit."""
+    return pd.DataFrame({
+        'id': ids,
+        'title': [f'Title {post_id}' for post_id in ids],
+        'subreddit': [subreddit] * len(ids),
+        'score': [10] * len(ids),
+        'num_comments': [num_comments] * len(ids),
+        'upvote_ratio': [0.9] * len(ids),
+        'created_utc': [1609459200] * len(ids)
+    })
+
+
+class TestRedditPipeline(unittest.TestCase):
+    """Test cases for RedditPipeline."""
+    
+    def setUp(self):
+        """Set up a pipeline with a fake extractor and a temporary output directory."""
+        output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        self.output_dir = Path(output_dir.name)
+        
+        config = MagicMock()
+        config.paths.output_path = self.output_dir
+        patchers = [
+            patch('src.pipelines.reddit_pipeline.get_config', return_value=config),
+            patch('src.pipelines.reddit_pipeline.RedditExtractor'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        self.pipeline = RedditPipeline()
+    
+    def set_chunks(self, chunks):
+        """Make the fake extractor yield the given (subreddit, DataFrame) chunks."""
+        self.pipeline.extractor.iter_dataframes.return_value = iter(chunks)
+    
+    def test_run_parquet_drops_ids_seen_in_earlier_chunks(self):
+        """Test Parquet output with a post extracted from two subreddits."""
+        self.set_chunks([
+            ('python', make_posts('python', ['a', 'b'])),
+            ('learnpython', make_posts('learnpython', ['b', 'c'])),
+        ])
+        
+        output_path = self.pipeline.run(['python', 'learnpython'], output_filename='posts')
+        
+        self.assertEqual(output_path, str(self.output_dir / 'posts.parquet'))
+        table = pq.read_table(output_path)
+        self.assertEqual(table.column('id').to_pylist(), ['a', 'b', 'c'])
+        self.assertEqual(pq.ParquetFile(output_path).num_row_groups, 2)
+    
+    def test_run_csv(self):
+        """Test CSV output is written with a single header."""
+        self.set_chunks([
+            ('python', make_posts('python', ['a', 'b'])),
+            ('learnpython', make_posts('learnpython', ['b', 'c'])),
+        ])
+        
+        output_path = self.pipeline.run(
+            ['python', 'learnpython'], output_filename='posts', file_format='csv'
+        )
+        
+        df = pd.read_csv(output_path)
+        self.assertEqual(df['id'].tolist(), ['a', 'b', 'c'])
+        self.assertEqual(df['subreddit'].tolist(), ['python', 'python', 'learnpython'])
+    
+    def test_run_validation_failure_removes_output(self):
+        """Test that output is removed when validation fails."""
+        self.set_chunks([
+            ('python', make_posts('python', ['a', 'b'])),
+            ('learnpython', make_posts('learnpython', ['c'], num_comments=-1)),
+        ])
+        
+        with self.assertRaises(RedditPipelineException) as context:
+            self.pipeline.run(['python', 'learnpython'], output_filename='posts')
+        
+        self.assertIn('negative comment counts', str(context.exception))
+        self.assertFalse((self.output_dir / 'posts.parquet').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
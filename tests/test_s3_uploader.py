@@ -0,0 +1,109 @@
+"""
+Unit tests for S3 uploader.
+"""
+
+import io
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import pyarrow.parquet as pq
+from src.ingestion.s3_uploader import S3Uploader, _prefetch_file
+from src.utils.exceptions import S3Exception
+
+
+def read_upload(uploads):
+    """Fake upload_fileobj that drains the source file in small reads."""
+    def upload_fileobj(Fileobj, Bucket, Key, Config, ExtraArgs):
+        body = bytearray()
+        while True:
+            data = Fileobj.read(8192)
+            if not data:
+                break
+            body.extend(data)
+        uploads[Key] = (bytes(body), ExtraArgs)
+    return upload_fileobj
+
+
+class TestS3Uploader(unittest.TestCase):
+    """Test cases for S3Uploader."""
+    
+    def setUp(self):
+        """Set up an uploader with a fake S3 client."""
+        patcher = patch.dict(os.environ, {'SKIP_BUCKET_CHECK': '1'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        with patch('src.ingestion.s3_uploader.boto3.client'):
+            self.uploader = S3Uploader(config={
+                'access_key_id': 'test_key',
+                'secret_access_key': 'test_secret',
+                'bucket_name': 'test-bucket'
+            })
+        self.uploads = {}
+        self.uploader.s3_client = MagicMock()
+        self.uploader.s3_client.upload_fileobj.side_effect = read_upload(self.uploads)
+    
+    def test_upload_stream(self):
+        """Test the writer output is streamed through the pipe in full."""
+        payload = os.urandom(1024 * 1024)  # Larger than the pipe buffer
+        
+        def write(sink):
+            for start in range(0, len(payload), 100_000):
+                sink.write(payload[start:start + 100_000])
+        
+        self.uploader._upload_stream(write, 'test-bucket', 'data.bin', 'text/csv', None)
+        
+        body, extra_args = self.uploads['data.bin']
+        self.assertEqual(body, payload)
+        self.assertEqual(extra_args, {'ContentType': 'text/csv'})
+    
+    def test_upload_stream_producer_error(self):
+        """Test a writer error fails the upload instead of ending the object early."""
+        def write(sink):
+            sink.write(b'partial')
+            raise ValueError("serialization failed")
+        
+        with self.assertRaises(ValueError):
+            self.uploader._upload_stream(write, 'test-bucket', 'data.bin', 'text/csv', None)
+        
+        self.assertNotIn('data.bin', self.uploads)
+    
+    def test_upload_dataframe_parquet(self):
+        """Test DataFrame upload as Parquet."""
+        df = pd.DataFrame({'id': ['1', '2'], 'score': [10, 20]})
+        
+        s3_uri = self.uploader.upload_dataframe(df, 'posts.parquet')
+        
+        self.assertEqual(s3_uri, 's3://test-bucket/posts.parquet')
+        body, extra_args = self.uploads['posts.parquet']
+        self.assertEqual(extra_args, {'ContentType': 'application/x-parquet'})
+        pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(body)), df)
+    
+    def test_upload_dataframe_row_groups_count_text(self):
+        """Test Parquet row groups are sized from the text, not object pointers."""
+        df = pd.DataFrame({'title': ['x' * 1000] * 100})
+        
+        with patch('src.ingestion.s3_uploader.PARQUET_ROW_GROUP_BYTES', 20_000):
+            self.uploader.upload_dataframe(df, 'posts.parquet')
+        
+        body, _ = self.uploads['posts.parquet']
+        self.assertGreater(pq.ParquetFile(io.BytesIO(body)).num_row_groups, 1)
+    
+    def test_upload_dataframe_error(self):
+        """Test a DataFrame serialization error is raised as S3Exception."""
+        df = pd.DataFrame({'id': ['1', '2']})
+        
+        with self.assertRaises(S3Exception):
+            self.uploader.upload_dataframe(df, 'posts.csv', format='csv', no_such_option=True)
+        
+        self.assertNotIn('posts.csv', self.uploads)
+    
+    def test_prefetch_unreadable_file(self):
+        """Test the prefetch hint is skipped for files that cannot be opened."""
+        _prefetch_file(Path('/nonexistent/posts.parquet'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Unit tests for sentiment analyzer.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.ml.sentiment_analyzer import (
+    EMPTY_VADER_SCORES,
+    SentimentAnalyzer,
+    VADER_COLUMNS,
+    _count_vader_labels,
+    summarize_vader,
+)
+
+
+def baseline_summary(df):
+    """Summary statistics as computed before the single-pass rewrite."""
+    summary = {}
+    if 'sentiment_label' in df.columns:
+        label_counts = df['sentiment_label'].value_counts().to_dict()
+        summary['label_distribution'] = label_counts
+        summary['label_percentages'] = {
+            label: count / len(df) * 100 for label, count in label_counts.items()
+        }
+    for column in ('vader_compound', 'transformer_score'):
+        if column in df.columns:
+            summary[f'{column}_stats'] = {
+                'mean': float(df[column].mean()),
+                'std': float(df[column].std()),
+                'min': float(df[column].min()),
+                'max': float(df[column].max())
+            }
+    return summary
+
+
+class TestSentimentSummary(unittest.TestCase):
+    """Test cases for sentiment summaries, which need no model."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.analyzer = SentimentAnalyzer(use_transformer=False)
+        compound = np.array([0.5, -0.3, 0.0, 0.05, -0.05, 0.9, 0.049], dtype=np.float32)
+        self.df = pd.DataFrame({
+            'vader_compound': compound,
+            'sentiment_label': np.where(
+                compound >= 0.05, 'POSITIVE', np.where(compound <= -0.05, 'NEGATIVE', 'NEUTRAL')
+            ),
+            'transformer_score': np.linspace(0.5, 0.99, len(compound), dtype=np.float32)
+        })
+    
+    def test_summary_matches_baseline(self):
+        """Test the summary against the original implementation."""
+        summary = self.analyzer.get_sentiment_summary(self.df)
+        expected = baseline_summary(self.df)
+        
+        self.assertEqual(summary['label_distribution'], expected['label_distribution'])
+        self.assertEqual(summary['label_percentages'], expected['label_percentages'])
+        for key in ('vader_compound_stats', 'transformer_score_stats'):
+            for stat, value in expected[key].items():
+                self.assertAlmostEqual(summary[key][stat], value, places=6)
+    
+    def test_summary_from_labels_only(self):
+        """Test the label distribution of a frame without VADER scores."""
+        df = self.df[['sentiment_label']].astype(
+            pd.CategoricalDtype(['NEGATIVE', 'NEUTRAL', 'POSITIVE'])
+        ).iloc[:3]
+        
+        summary = self.analyzer.get_sentiment_summary(df)
+        
+        self.assertEqual(summary['label_distribution'], {'POSITIVE': 1, 'NEGATIVE': 1, 'NEUTRAL': 1})
+    
+    def test_summarize_vader(self):
+        """Test label counting at the thresholds, with NaN counted as neutral."""
+        compound = np.array([0.05, -0.05, 0.0499, -0.0499, np.nan, 1.0])
+        
+        self.assertEqual(summarize_vader(compound), (1, 3, 2))
+        self.assertEqual(tuple(_count_vader_labels(compound)), (1, 3, 2))
+    
+    def test_column_stats(self):
+        """Test column statistics for single and missing values."""
+        single = SentimentAnalyzer._column_stats(pd.Series([0.5, None]))
+        self.assertEqual(single['mean'], 0.5)
+        self.assertTrue(np.isnan(single['std']))
+        
+        empty = SentimentAnalyzer._column_stats(pd.Series([None, None], dtype='float64'))
+        self.assertTrue(all(np.isnan(value) for value in empty.values()))
+    
+    def test_is_accelerator(self):
+        """Test which pipeline devices count as accelerators."""
+        for device in (0, 1, 'cuda', 'cuda:1', 'mps'):
+            self.assertTrue(SentimentAnalyzer._is_accelerator(device))
+        for device in (-1, 'cpu'):
+            self.assertFalse(SentimentAnalyzer._is_accelerator(device))
+        self.assertEqual(SentimentAnalyzer._resolve_device('cpu'), 'cpu')
+
+
+class TestSentimentAnalyzerVader(unittest.TestCase):
+    """Test cases for VADER scoring."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one VADER-only analyzer, skipping without NLTK or its lexicon."""
+        cls.analyzer = SentimentAnalyzer(use_transformer=False)
+        if cls.analyzer.vader is None:
+            raise unittest.SkipTest("VADER is not available")
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({
+            'title': [
+                'I love this!', 'This is terrible.', 'I love this!', None, '',
+                'Just a title', 'This is terrible.', 'Great news, awful timing'
+            ]
+        })
+    
+    def test_analyze_vader_empty_text(self):
+        """Test missing and empty text get the neutral scores and keys."""
+        for text in (None, ''):
+            self.assertEqual(self.analyzer.analyze_vader(text), EMPTY_VADER_SCORES)
+    
+    def test_duplicate_texts_score_identically(self):
+        """Test repeated texts get the scores of scoring each row on its own."""
+        result = self.analyzer.analyze_dataframe(self.df, show_progress=False)
+        
+        for (_, row), text in zip(result.iterrows(), self.df['title']):
+            expected = self.analyzer.analyze_vader(text)
+            for column in VADER_COLUMNS:
+                self.assertAlmostEqual(row[column], expected[column], places=6)
+        pd.testing.assert_series_equal(
+            result.loc[0, list(VADER_COLUMNS)], result.loc[2, list(VADER_COLUMNS)], check_names=False
+        )
+        self.assertEqual(list(result['sentiment_label'].cat.categories), ['NEGATIVE', 'NEUTRAL', 'POSITIVE'])
+    
+    def test_n_jobs_matches_single_process(self):
+        """Test process-pool scoring gives the same output as one process."""
+        single = self.analyzer.analyze_dataframe(self.df, show_progress=False, n_jobs=1)
+        pooled = self.analyzer.analyze_dataframe(self.df, show_progress=False, n_jobs=2)
+        
+        pd.testing.assert_frame_equal(pooled, single)
+    
+    def test_inplace(self):
+        """Test inplace adds the columns to the frame and the default does not."""
+        df = self.df.copy()
+        
+        result = self.analyzer.analyze_dataframe(df, show_progress=False)
+        self.assertNotIn('vader_compound', df.columns)
+        self.assertIn('vader_compound', result.columns)
+        
+        result = self.analyzer.analyze_dataframe(df, show_progress=False, inplace=True)
+        self.assertIs(result, df)
+        self.assertIn('vader_compound', df.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()